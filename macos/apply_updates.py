@@ -6,24 +6,17 @@ import argparse
 import sys
 from pathlib import Path
 
-BASE_DIR = Path(__file__).resolve().parents[1]
-DEFAULT_CONFIG_PATH = BASE_DIR / "config" / "config.yaml"
+BASE_DIR = Path(__file__).resolve().parent.parent
 if str(BASE_DIR) not in sys.path:
     sys.path.insert(0, str(BASE_DIR))
 
-from python_common.workflow import ApplyUpdatesOptions, apply_updates
+from python_common.cli import common_parent_parser
 
 
 def build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
-        description="Apply Freshservice ticket category updates (macOS edition)."
-    )
-    parser.add_argument(
-        "--config",
-        help=(
-            "Path to configuration YAML file. Defaults to "
-            f"{DEFAULT_CONFIG_PATH} or config/config.yaml if present."
-        ),
+        description="Apply Freshservice ticket category updates (macOS edition).",
+        parents=[common_parent_parser()],
     )
     parser.add_argument("--review-csv", help="Path to the reviewed CSV containing manager decisions.")
     parser.add_argument(
@@ -35,26 +28,6 @@ def build_parser() -> argparse.ArgumentParser:
     parser.add_argument("--category", help="Override category when using --ticket-id.")
     parser.add_argument("--sub-category", help="Override sub-category when using --ticket-id.")
     parser.add_argument("--item-category", help="Override item category when using --ticket-id.")
-    parser.add_argument(
-        "--disable-console-log",
-        action="store_true",
-        help="Disable console logging output (deprecated; logging is hidden unless --show-console-log is provided).",
-    )
-    parser.add_argument(
-        "--show-console-log",
-        action="store_true",
-        help="Show detailed log output instead of the default progress display.",
-    )
-    parser.add_argument(
-        "--simple-console",
-        action="store_true",
-        help="Use a simple console log format instead of Rich formatting.",
-    )
-    parser.add_argument(
-        "--console-level",
-        choices=["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"],
-        help="Override the console logging level.",
-    )
     parser.add_argument(
         "--dry-run",
         action="store_true",
@@ -81,6 +54,9 @@ def build_parser() -> argparse.ArgumentParser:
 def main() -> None:
     parser = build_parser()
     args = parser.parse_args()
+
+    from python_common.workflow import ApplyUpdatesOptions, apply_updates
+
     base_dir = BASE_DIR
     options = ApplyUpdatesOptions(
         config_path=args.config,
@@ -6,24 +6,17 @@ import argparse
 import sys
 from pathlib import Path
 
-BASE_DIR = Path(__file__).resolve().parents[1]
-DEFAULT_CONFIG_PATH = BASE_DIR / "config" / "config.yaml"
+BASE_DIR = Path(__file__).resolve().parent.parent
 if str(BASE_DIR) not in sys.path:
     sys.path.insert(0, str(BASE_DIR))
 
-from python_common.workflow import ReportOptions, generate_reports
+from python_common.cli import common_parent_parser
 
 
 def build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
-        description="Generate HTML/PDF/image reports for Freshservice tickets (macOS edition)."
-    )
-    parser.add_argument(
-        "--config",
-        help=(
-            "Path to configuration YAML file. Defaults to "
-            f"{DEFAULT_CONFIG_PATH} or config/config.yaml if present."
-        ),
+        description="Generate HTML/PDF/image reports for Freshservice tickets (macOS edition).",
+        parents=[common_parent_parser()],
     )
     parser.add_argument(
         "--output-directory",
@@ -47,32 +40,15 @@ def build_parser() -> argparse.ArgumentParser:
         choices=["html", "pdf", "images", "json"],
         help="Report output formats to generate (default: html, pdf, images, json).",
     )
-    parser.add_argument(
-        "--disable-console-log",
-        action="store_true",
-        help="Disable console logging output (deprecated; logs hidden unless --show-console-log is provided).",
-    )
-    parser.add_argument(
-        "--show-console-log",
-        action="store_true",
-        help="Show detailed log output instead of the default progress display.",
-    )
-    parser.add_argument(
-        "--simple-console",
-        action="store_true",
-        help="Use a simple console log format instead of Rich formatting.",
-    )
-    parser.add_argument(
-        "--console-level",
-        choices=["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"],
-        help="Override the console logging level.",
-    )
     return parser
 
 
 def main() -> None:
     parser = build_parser()
     args = parser.parse_args()
+
+    from python_common.workflow import ReportOptions, generate_reports
+
     base_dir = BASE_DIR
     options = ReportOptions(
         config_path=args.config,
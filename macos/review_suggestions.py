@@ -7,17 +7,16 @@ import csv
 import logging
 import sys
 from collections import Counter
+from contextlib import contextmanager
+from operator import attrgetter
 from pathlib import Path
-from typing import List
+from typing import Iterator, Sequence, TextIO
 
-BASE_DIR = Path(__file__).resolve().parents[1]
-DEFAULT_CONFIG_PATH = BASE_DIR / "config" / "config.yaml"
+BASE_DIR = Path(__file__).resolve().parent.parent
 if str(BASE_DIR) not in sys.path:
     sys.path.insert(0, str(BASE_DIR))
 
-from python_common.config import ConfigError, load_config
-from python_common.logging_setup import configure_logging
-from python_common.workflow import ReviewOptions, review_rows
+from python_common.cli import DEFAULT_CONFIG_HELP
 
 LOGGER = logging.getLogger(__name__)
 
@@ -29,7 +28,7 @@ def build_parser() -> argparse.ArgumentParser:
         "--config",
         help=(
             "Optional configuration file to control logging behaviour. Defaults to "
-            f"{DEFAULT_CONFIG_PATH} or config/config.yaml if present."
+            f"{DEFAULT_CONFIG_HELP}."
         ),
     )
     parser.add_argument(
@@ -46,6 +45,9 @@ def build_parser() -> argparse.ArgumentParser:
 
 
 def setup_logging(config_path: str | None, base_dir: Path) -> None:
+    from python_common.config import ConfigError, load_config
+    from python_common.logging_setup import configure_logging
+
     try:
         config = load_config(config_path)
     except ConfigError:
@@ -62,21 +64,37 @@ def setup_logging(config_path: str | None, base_dir: Path) -> None:
     configure_logging(config, base_dir=base_dir)
 
 
-def export_rows(rows: List[dict], destination: Path) -> None:
+class _ExportWriter:
+    """CSV writer that defers the header until the first exported row."""
+
+    def __init__(self, handle: TextIO, header: Sequence[str]) -> None:
+        self._writer = csv.writer(handle)
+        self._header = header
+        self.count = 0
+
+    def writerow(self, row: Sequence[str]) -> None:
+        if not self.count:
+            self._writer.writerow(self._header)
+        self._writer.writerow(row)
+        self.count += 1
+
+
+@contextmanager
+def open_export_writer(destination: Path, header: Sequence[str]) -> Iterator[_ExportWriter]:
     destination.parent.mkdir(parents=True, exist_ok=True)
-    with destination.open("w", encoding="utf-8", newline="") as handle:
-        if not rows:
+    with destination.open("w", encoding="utf-8", newline="", buffering=1 << 20) as handle:
+        writer = _ExportWriter(handle, header)
+        yield writer
+        if not writer.count:
             handle.write("No rows matched the provided filter.\n")
-            return
-        writer = csv.DictWriter(handle, fieldnames=rows[0].keys())
-        writer.writeheader()
-        for row in rows:
-            writer.writerow(row)
 
 
 def main() -> None:
     parser = build_parser()
     args = parser.parse_args()
+
+    from python_common.workflow import ReviewOptions, review_rows
+
     base_dir = BASE_DIR
     setup_logging(args.config, base_dir)
 
@@ -84,22 +102,31 @@ def main() -> None:
     rows = review_rows(options)
     LOGGER.info("Review rows loaded: %s", len(rows))
 
-    counter = Counter(row.manager_decision for row in rows)
+    counter = Counter(map(attrgetter("manager_decision"), rows))
     for decision, count in counter.items():
         LOGGER.info("%s: %s", decision, count)
 
     if args.export:
-        worksheet_rows = []
-        with Path(args.review_csv).open("r", encoding="utf-8", newline="") as handle:
-            reader = csv.DictReader(handle)
-            for row in reader:
-                decision = (row.get("manager_decision") or "").strip().lower()
-                if args.decision and decision not in {d.lower() for d in args.decision}:
-                    continue
-                worksheet_rows.append(row)
+        decision_filter = frozenset(d.lower() for d in args.decision) if args.decision else None
         export_path = Path(args.export)
-        export_rows(worksheet_rows, export_path)
-        LOGGER.info("Exported %s rows to %s", len(worksheet_rows), export_path)
+        with Path(args.review_csv).open("r", encoding="utf-8", newline="") as handle:
+            reader = csv.reader(handle)
+            header = next(reader, [])
+            decision_index = header.index("manager_decision") if "manager_decision" in header else None
+            with open_export_writer(export_path, header) as writer:
+                for row in reader:
+                    if not row:
+                        continue
+                    if len(row) < len(header):
+                        # Short rows export blank trailing cells, as csv.DictWriter wrote them.
+                        row += [""] * (len(header) - len(row))
+                    if decision_filter is not None:
+                        if decision_index is None:
+                            continue
+                        if row[decision_index].strip().lower() not in decision_filter:
+                            continue
+                    writer.writerow(row)
+        LOGGER.info("Exported %s rows to %s", writer.count, export_path)
 
 
 if __name__ == "__main__":
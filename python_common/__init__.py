@@ -1,13 +1,29 @@
 """Shared modules for Freshservice ticket analysis scripts."""
 
-from .config import load_config, resolve_path
-from .logging_setup import configure_logging
-from .freshservice_client import FreshserviceClient
-from .analysis import TicketAnalyzer
-from .report_generation import TicketReportBuilder
-from .reporting import TicketReportWriter
-from .review import ReviewWorksheet
-from .updates import TicketUpdater
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:  # pragma: no cover - imports for static analysis only
+    from .analysis import TicketAnalyzer
+    from .config import load_config, resolve_path
+    from .freshservice_client import FreshserviceClient
+    from .logging_setup import configure_logging
+    from .report_generation import TicketReportBuilder
+    from .reporting import TicketReportWriter
+    from .review import ReviewWorksheet
+    from .updates import TicketUpdater
+
+_LAZY_ATTRIBUTES = {
+    "load_config": ".config",
+    "resolve_path": ".config",
+    "configure_logging": ".logging_setup",
+    "FreshserviceClient": ".freshservice_client",
+    "TicketAnalyzer": ".analysis",
+    "TicketReportBuilder": ".report_generation",
+    "TicketReportWriter": ".reporting",
+    "ReviewWorksheet": ".review",
+    "TicketUpdater": ".updates",
+}
 
 __all__ = [
     "load_config",
@@ -20,3 +36,17 @@ __all__ = [
     "ReviewWorksheet",
     "TicketUpdater",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import public helpers on first access so CLI start-up stays light."""
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
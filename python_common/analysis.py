@@ -1,21 +1,29 @@
 """Keyword and taxonomy driven analysis for Freshservice tickets."""
 from __future__ import annotations
 
+import heapq
 import logging
 import math
 import re
 from collections import Counter, defaultdict
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from datetime import datetime, timezone
+from functools import lru_cache
+from itertools import chain
+from operator import itemgetter
 from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
 
 from dateutil import parser as date_parser
-from rapidfuzz import fuzz
+from rapidfuzz import fuzz, process
 
-from .taxonomy import TaxonomyModel
+from .taxonomy import TaxonomyModel, TaxonomyNode
 
 LOGGER = logging.getLogger(__name__)
+
+# Lowercased text, raw tokens, filtered keyword tokens and raw token set of one ticket.
+TicketTokens = Tuple[str, List[str], List[str], frozenset[str]]
 TOKEN_PATTERN = re.compile(r"[A-Za-z0-9_]+")
+_WORDY_FULLMATCH = TOKEN_PATTERN.fullmatch
 CLASSIFICATION_SNIPPET = 240
 
 _FUZZY_WHITELIST = {
@@ -36,25 +44,42 @@ _FUZZY_MAX_BOOST = 0.12
 _FUZZY_NEW_MATCH_BASE = 0.45
 _FUZZY_NEW_MATCH_CAP = 0.6
 
+# Below this many substring keywords a plain ``in`` scan per keyword beats
+# building the trigram set of every ticket text.
+_SUBSTRING_INDEX_MIN_KEYWORDS = 256
+
 
 def _to_utc_display(value: Any) -> Optional[str]:
     if not value:
         return None
     if isinstance(value, datetime):
-        dt = value
-    else:
+        return _format_utc(value)
+    return _parse_utc_display(str(value))
+
+
+@lru_cache(maxsize=4096)
+def _parse_utc_display(raw: str) -> Optional[str]:
+    # Freshservice returns ISO 8601 timestamps, which the C parser handles directly;
+    # dateutil is only needed for anything more exotic.
+    try:
+        dt = datetime.fromisoformat(raw[:-1] + "+00:00" if raw.endswith("Z") else raw)
+    except ValueError:
         try:
-            dt = date_parser.parse(str(value))
+            dt = date_parser.parse(raw)
         except (ValueError, TypeError):  # pragma: no cover - defensive
-            LOGGER.debug("Unable to parse datetime value %r", value)
+            LOGGER.debug("Unable to parse datetime value %r", raw)
             return None
+    return _format_utc(dt)
+
+
+def _format_utc(dt: datetime) -> str:
     if dt.tzinfo is None:
         dt = dt.replace(tzinfo=timezone.utc)
     dt_utc = dt.astimezone(timezone.utc)
     return dt_utc.strftime("%Y-%m-%d %H:%M:%S UTC")
 
 
-@dataclass
+@dataclass(slots=True)
 class TicketRecord:
     id: int
     subject: str
@@ -82,7 +107,7 @@ class TicketRecord:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class SuggestedCategory:
     category: Optional[str]
     sub_category: Optional[str]
@@ -91,7 +116,7 @@ class SuggestedCategory:
     rationale: str
 
 
-@dataclass
+@dataclass(slots=True)
 class _MatchResult:
     path: Tuple[str, ...]
     confidence: float
@@ -105,7 +130,7 @@ class _MatchResult:
     priority_override: Optional[int] = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class _ProximityRule:
     path: Tuple[str, ...]
     term_groups: Tuple[Tuple[Tuple[str, ...], ...], ...]
@@ -114,7 +139,7 @@ class _ProximityRule:
     description: str = "proximity"
 
 
-@dataclass
+@dataclass(slots=True)
 class _TfidfArtifacts:
     ticket_vectors: List[Dict[str, float]]
     prototype_vectors: List[Dict[str, float]]
@@ -144,8 +169,28 @@ class TicketAnalyzer:
         self.keyword_overrides = keyword_overrides or {}
         self.tfidf_leaf_threshold = max(0.0, float(tfidf_leaf_threshold))
         self.tfidf_weight = max(0.0, float(tfidf_weight))
+        self._keyword_index = self._build_keyword_index()
+        # Keyword tokens are constant for the lifetime of the taxonomy, so tokenise them once.
+        self._node_keyword_tokens = {
+            path: [
+                token for keyword in node.keywords for token in self._raw_tokens(keyword.lower())
+            ]
+            for path, node in self.taxonomy.nodes_by_path.items()
+        }
+        # Lowercased "A > B > C" paths; the separator cannot create false substring hits.
+        self._lowered_paths = {
+            path: " > ".join(path).lower() for path in self.taxonomy.nodes_by_path
+        }
+        self._substring_keywords = tuple(
+            sorted(set().union(*(entry[2] for entry in self._keyword_index.values())))
+        )
+        self._substring_index = self._build_substring_index(self._substring_keywords)
+        self._keyword_nodes = [entry[0] for entry in self._keyword_index.values()]
+        self._nodes_by_norm = self._build_norm_postings()
         self._proximity_rules = self._build_proximity_rules()
         self._fuzzy_terms = self._build_fuzzy_terms()
+        self._fuzzy_seeds = tuple(sorted(set().union(*self._fuzzy_terms.values())))
+        self._fallback_path = self._find_fallback_path()
 
     @staticmethod
     def _raw_tokens(text: str) -> List[str]:
@@ -159,18 +204,43 @@ class TicketAnalyzer:
     def tokenize(self, text: str) -> List[str]:
         return self._filter_tokens(self._raw_tokens(text))
 
+    def _tokenize_once(self, text: str) -> TicketTokens:
+        """Return the lowercased text, raw tokens, filtered keyword tokens and raw token set.
+
+        Results are shared between tickets with identical text and between the
+        classification and keyword passes, so they must not be mutated.
+        """
+        text_lower = text.lower()
+        if text.isascii():
+            # Tokens are ASCII runs, so lowercasing the text first is equivalent and
+            # avoids a lower() call per token.
+            raw_tokens = TOKEN_PATTERN.findall(text_lower)
+        else:
+            raw_tokens = self._raw_tokens(text)
+        min_length = self.keyword_min_length
+        stop_words = self.stop_words
+        filtered = [t for t in raw_tokens if len(t) >= min_length and t not in stop_words]
+        return text_lower, raw_tokens, filtered, frozenset(raw_tokens)
+
     def keyword_counts(self, tickets: Iterable[TicketRecord]) -> Counter[str]:
         counts: Counter[str] = Counter()
+        update = counts.update
+        findall = TOKEN_PATTERN.findall
+        min_length = self.keyword_min_length
+        stop_words = self.stop_words
         for ticket in tickets:
             text = f"{ticket.subject or ''} {ticket.description_text or ''}"
-            tokens = self.tokenize(text)
-            counts.update(tokens)
+            update(
+                token
+                for token in map(str.lower, findall(text))
+                if len(token) >= min_length and token not in stop_words
+            )
         return counts
 
     def _matches_term(self, term: str, norm: str, *, text_lower: str, token_set: set[str]) -> bool:
         if not norm:
             return False
-        if re.fullmatch(r"[A-Za-z0-9_]+", norm):
+        if _WORDY_FULLMATCH(norm):
             return norm in token_set
         return norm in text_lower
 
@@ -250,16 +320,96 @@ class TicketAnalyzer:
             )
         return matches
 
-    def _match_taxonomy(self, *, text: str, token_set: set[str]) -> Dict[Tuple[str, ...], _MatchResult]:
-        matches: Dict[Tuple[str, ...], _MatchResult] = {}
-        text_lower = text.lower()
+    def _build_keyword_index(
+        self,
+    ) -> Dict[Tuple[str, ...], Tuple[TaxonomyNode, frozenset[str], frozenset[str]]]:
+        """Split each node's keywords into whole-token and substring matchers once."""
+        index: Dict[Tuple[str, ...], Tuple[TaxonomyNode, frozenset[str], frozenset[str]]] = {}
         for node in self.taxonomy.iter_nodes():
-            matched_keywords: List[str] = []
-            for keyword, norm in zip(node.keywords, node.keyword_norms):
-                if self._matches_term(keyword, norm, text_lower=text_lower, token_set=token_set):
-                    matched_keywords.append(keyword)
-            if not matched_keywords:
-                continue
+            token_norms: set[str] = set()
+            substring_norms: set[str] = set()
+            for norm in node.keyword_norms:
+                if not norm:
+                    continue
+                if _WORDY_FULLMATCH(norm):
+                    token_norms.add(norm)
+                else:
+                    substring_norms.add(norm)
+            index[node.path] = (node, frozenset(token_norms), frozenset(substring_norms))
+        return index
+
+    def _build_norm_postings(self) -> Dict[str, Tuple[int, ...]]:
+        """Map every keyword norm to the positions of the nodes that carry it.
+
+        Word-shaped norms can only hit through the ticket's token set and the rest
+        only through substring hits, so a single map covers both.
+        """
+        postings: Dict[str, List[int]] = defaultdict(list)
+        for position, (_, token_norms, substring_norms) in enumerate(self._keyword_index.values()):
+            for norm in token_norms | substring_norms:
+                postings[norm].append(position)
+        return {norm: tuple(positions) for norm, positions in postings.items()}
+
+    @staticmethod
+    def _build_substring_index(
+        keywords: Sequence[str],
+    ) -> Optional[Tuple[Dict[str, Tuple[str, ...]], Tuple[str, ...]]]:
+        """Bucket keywords by their rarest trigram for large taxonomies.
+
+        A keyword can only occur in a text that contains every one of its
+        trigrams, so each ticket only needs to check the buckets whose trigram
+        appears in it. Keywords shorter than three characters are always checked.
+        """
+        if len(keywords) < _SUBSTRING_INDEX_MIN_KEYWORDS:
+            return None
+        trigrams = {
+            keyword: {keyword[i : i + 3] for i in range(len(keyword) - 2)} for keyword in keywords
+        }
+        frequency = Counter(chain.from_iterable(trigrams.values()))
+        buckets: Dict[str, List[str]] = defaultdict(list)
+        short: List[str] = []
+        for keyword, grams in trigrams.items():
+            if grams:
+                buckets[min(grams, key=lambda gram: (frequency[gram], gram))].append(keyword)
+            else:
+                short.append(keyword)
+        return {gram: tuple(bucket) for gram, bucket in buckets.items()}, tuple(short)
+
+    def _find_substring_keywords(self, text_lower: str) -> set[str]:
+        if self._substring_index is None:
+            return {norm for norm in self._substring_keywords if norm in text_lower}
+        buckets, short = self._substring_index
+        grams = {text_lower[i : i + 3] for i in range(len(text_lower) - 2)}
+        hits = {
+            norm
+            for gram in buckets.keys() & grams
+            for norm in buckets[gram]
+            if norm in text_lower
+        }
+        hits.update(norm for norm in short if norm in text_lower)
+        return hits
+
+    def _match_taxonomy(
+        self, *, text_lower: str, token_set: frozenset[str]
+    ) -> Dict[Tuple[str, ...], _MatchResult]:
+        matches: Dict[Tuple[str, ...], _MatchResult] = {}
+        # Each distinct substring keyword is searched for once per ticket, however
+        # many nodes share it.
+        substring_hits = self._find_substring_keywords(text_lower)
+        nodes_by_norm = self._nodes_by_norm
+        hit_norms = substring_hits.union(nodes_by_norm.keys() & token_set)
+        if not hit_norms:
+            return matches
+        # Visit only nodes sharing a keyword with the ticket, in taxonomy order.
+        positions = sorted({position for norm in hit_norms for position in nodes_by_norm[norm]})
+        keyword_nodes = self._keyword_nodes
+        for position in positions:
+            node = keyword_nodes[position]
+            matched_keywords = [
+                keyword
+                for keyword, norm in zip(node.keywords, node.keyword_norms)
+                if norm in token_set or norm in substring_hits
+            ]
             confidence = self._confidence(keyword_hits=len(matched_keywords), depth=len(node.path))
             rationale = self._build_rationale(
                 path=node.path,
@@ -340,7 +490,14 @@ class TicketAnalyzer:
                 description="intune policy proximity",
             )
         )
-        return rules
+        # Rules for paths missing from this taxonomy can never fire. The rest take
+        # the taxonomy's own path tuple so match-map lookups share one key object.
+        active: List[_ProximityRule] = []
+        for rule in rules:
+            node = self.taxonomy.get_node(rule.path)
+            if node and len(rule.term_groups) >= 2:
+                active.append(replace(rule, path=node.path))
+        return active
 
     def _build_fuzzy_terms(self) -> Dict[Tuple[str, ...], set[str]]:
         mapping: Dict[Tuple[str, ...], set[str]] = {}
@@ -349,10 +506,9 @@ class TicketAnalyzer:
             return mapping
         for node in self.taxonomy.iter_nodes():
             candidates: set[str] = set()
-            for keyword in node.keywords:
-                for token in self._raw_tokens(keyword.lower()):
-                    if token in whitelist:
-                        candidates.add(token)
+            for token in self._node_keyword_tokens.get(node.path, ()):
+                if token in whitelist:
+                    candidates.add(token)
             for token in self._raw_tokens(node.label.lower()):
                 if token in whitelist:
                     candidates.add(token)
@@ -361,18 +517,19 @@ class TicketAnalyzer:
         return mapping
 
     @staticmethod
-    def _phrase_positions(tokens: Sequence[str], phrase: Tuple[str, ...]) -> List[int]:
+    def _phrase_positions(
+        tokens: Sequence[str],
+        phrase: Tuple[str, ...],
+        positions_by_token: Dict[str, List[int]],
+    ) -> List[int]:
         if not phrase:
             return []
-        window = len(phrase)
-        if window == 0 or window > len(tokens):
-            return []
-        positions: List[int] = []
-        token_tuple = tuple(tokens)
-        for index in range(len(tokens) - window + 1):
-            if token_tuple[index : index + window] == phrase:
-                positions.append(index)
-        return positions
+        starts = positions_by_token.get(phrase[0], [])
+        if len(phrase) == 1:
+            return starts
+        width = len(phrase)
+        remainder = phrase[1:]
+        return [index for index in starts if tuple(tokens[index + 1 : index + width]) == remainder]
 
     def _apply_proximity_boosts(
         self,
@@ -381,28 +538,32 @@ class TicketAnalyzer:
     ) -> None:
         if not tokens:
             return
+        positions_by_token: Dict[str, List[int]] = defaultdict(list)
+        for position, token in enumerate(tokens):
+            positions_by_token[token].append(position)
+        phrase_positions = self._phrase_positions
         for rule in self._proximity_rules:
-            if not rule.term_groups or len(rule.term_groups) < 2:
-                continue
-            if not self.taxonomy.get_node(rule.path):
-                continue
             positions_groups: List[List[int]] = []
             for group in rule.term_groups:
                 group_positions: List[int] = []
                 for phrase in group:
-                    group_positions.extend(self._phrase_positions(tokens, phrase))
+                    group_positions.extend(phrase_positions(tokens, phrase, positions_by_token))
                 if not group_positions:
                     positions_groups = []
                     break
-                positions_groups.append(sorted(set(group_positions)))
+                positions_groups.append(group_positions)
             if not positions_groups:
                 continue
+            # The window test only needs membership, so positions stay unsorted and
+            # may repeat when phrases in a group overlap.
             anchor_positions = positions_groups[0]
+            other_groups = positions_groups[1:]
+            window = rule.window
             found = False
             for anchor in anchor_positions:
                 within_window = True
-                for others in positions_groups[1:]:
-                    if not any(abs(anchor - pos) <= rule.window for pos in others):
+                for others in other_groups:
+                    if not any(abs(anchor - pos) <= window for pos in others):
                         within_window = False
                         break
                 if within_window:
@@ -439,47 +600,69 @@ class TicketAnalyzer:
                     match_map[rule.path].confidence,
                 )
 
+    @staticmethod
+    def _best_fuzzy_token(
+        seed: str, token_set: frozenset[str], fuzzy_tokens: Sequence[str]
+    ) -> Optional[Tuple[str, float]]:
+        if seed in token_set:
+            return seed, 100
+        if not fuzzy_tokens:
+            return None
+        result = process.extractOne(
+            seed,
+            fuzzy_tokens,
+            scorer=fuzz.partial_ratio,
+            score_cutoff=_FUZZY_SCORE_THRESHOLD,
+        )
+        if result is None:
+            return None
+        return result[0], result[1]
+
     def _apply_fuzzy_matches(
         self,
         match_map: Dict[Tuple[str, ...], _MatchResult],
         raw_tokens: Sequence[str],
-        token_set: set[str],
+        token_set: frozenset[str],
     ) -> None:
         if not self._fuzzy_terms or not raw_tokens:
             return
-        unique_tokens = set(raw_tokens)
-        fuzzy_tokens = {token for token in unique_tokens if len(token) >= 3}
+        fuzzy_tokens = list({token for token in token_set if len(token) >= 3})
+        # Seeds are shared between paths, so score each one against the ticket once
+        # and bail out before walking the paths when none of them hit.
+        best_fuzzy_token = self._best_fuzzy_token
+        seed_hits: Dict[str, Tuple[str, float]] = {}
+        for seed in self._fuzzy_seeds:
+            hit = best_fuzzy_token(seed, token_set, fuzzy_tokens)
+            if hit is not None:
+                seed_hits[seed] = hit
+        if not seed_hits:
+            return
+        get_node = self.taxonomy.get_node
+        threshold = _FUZZY_SCORE_THRESHOLD
+        max_boost = _FUZZY_MAX_BOOST
         for path, seeds in self._fuzzy_terms.items():
-            if not seeds:
+            if seeds.isdisjoint(seed_hits):
                 continue
-            node = self.taxonomy.get_node(path)
+            node = get_node(path)
             if not node:
                 continue
-            best_score = 0
+            best_score: float = 0
             best_seed: Optional[str] = None
             best_token: Optional[str] = None
             for seed in seeds:
-                if seed in token_set:
-                    best_score = 100
+                hit = seed_hits.get(seed)
+                if hit is None:
+                    continue
+                token, score = hit
+                if score > best_score:
+                    best_score = score
                     best_seed = seed
-                    best_token = seed
-                    break
-                for token in fuzzy_tokens:
-                    if token == seed:
-                        best_score = 100
-                        best_seed = seed
-                        best_token = token
-                        break
-                    score = fuzz.partial_ratio(seed, token)
-                    if score > best_score:
-                        best_score = score
-                        best_seed = seed
-                        best_token = token
+                    best_token = token
                 if best_score == 100:
                     break
-            if best_score < _FUZZY_SCORE_THRESHOLD or not best_seed or not best_token:
+            if best_score < threshold or not best_seed or not best_token:
                 continue
-            boost = min(_FUZZY_MAX_BOOST, (best_score / 100.0) * _FUZZY_MAX_BOOST)
+            boost = min(max_boost, (best_score / 100.0) * max_boost)
             rationale_note = f"fuzzy {best_seed}->{best_token} {best_score:.0f}"
             if path in match_map:
                 match = match_map[path]
@@ -515,35 +698,42 @@ class TicketAnalyzer:
     def _apply_negative_keywords(
         self,
         match_map: Dict[Tuple[str, ...], _MatchResult],
-        tokens: Sequence[str],
+        token_set: frozenset[str],
         text_lower: str,
     ) -> None:
         if not match_map:
             return
-        token_set = set(tokens)
         citrix_path = ("Remote Access", "Citrix (Legacy)")
-        if citrix_path in match_map and any(term in token_set for term in ("anyware", "rdp", "cato")):
+        citrix_context = citrix_path in match_map and not token_set.isdisjoint(
+            ("anyware", "rdp", "cato")
+        )
+        vpn_guard = "not vpn" in text_lower
+        teams_guard = "not a teams issue" in text_lower or "not a teams problem" in text_lower
+        if not (citrix_context or vpn_guard or teams_guard):
+            return
+
+        priority_get = self.taxonomy.priority_map.get
+        priority_count = len(self.taxonomy.priority_map)
+        default_priority = priority_count + 1
+        lowered_paths = self._lowered_paths
+        if citrix_context:
             match = match_map[citrix_path]
             original = match.confidence
             match.confidence = round(max(match.confidence - 0.3, 0.05), 2)
-            base_priority = self.taxonomy.priority_map.get(
-                match.path, len(self.taxonomy.priority_map) + 1
-            )
-            match.priority_override = base_priority + len(self.taxonomy.priority_map) + 10
+            base_priority = priority_get(match.path, default_priority)
+            match.priority_override = base_priority + priority_count + 10
             match.rationale += "; demoted due to Anyware/RDP context"
             LOGGER.debug(
                 "Applied Citrix demotion %.2f -> %.2f", original, match.confidence
             )
 
-        if "not vpn" in text_lower:
+        if vpn_guard:
             for match in match_map.values():
-                if any("vpn" in part.lower() for part in match.path):
+                if "vpn" in (lowered_paths.get(match.path) or " > ".join(match.path).lower()):
                     original = match.confidence
                     match.confidence = round(max(match.confidence - 0.45, 0.05), 2)
-                    base_priority = self.taxonomy.priority_map.get(
-                        match.path, len(self.taxonomy.priority_map) + 1
-                    )
-                    match.priority_override = base_priority + len(self.taxonomy.priority_map) + 5
+                    base_priority = priority_get(match.path, default_priority)
+                    match.priority_override = base_priority + priority_count + 5
                     match.rationale += "; reduced by 'not vpn' guard"
                     LOGGER.debug(
                         "Reduced VPN-related confidence %.2f -> %.2f due to 'not vpn'",
@@ -551,15 +741,13 @@ class TicketAnalyzer:
                         match.confidence,
                     )
 
-        if "not a teams issue" in text_lower or "not a teams problem" in text_lower:
+        if teams_guard:
             for match in match_map.values():
-                if any("teams" in part.lower() for part in match.path):
+                if "teams" in (lowered_paths.get(match.path) or " > ".join(match.path).lower()):
                     original = match.confidence
                     match.confidence = round(max(match.confidence - 0.35, 0.05), 2)
-                    base_priority = self.taxonomy.priority_map.get(
-                        match.path, len(self.taxonomy.priority_map) + 1
-                    )
-                    match.priority_override = base_priority + len(self.taxonomy.priority_map) + 5
+                    base_priority = priority_get(match.path, default_priority)
+                    match.priority_override = base_priority + priority_count + 5
                     match.rationale += "; reduced by 'not a teams issue' guard"
                     LOGGER.debug(
                         "Reduced Teams-related confidence %.2f -> %.2f due to Teams guard",
@@ -567,20 +755,10 @@ class TicketAnalyzer:
                         match.confidence,
                     )
 
-    def _build_tfidf_artifacts(self, tickets: List[TicketRecord]) -> Optional[_TfidfArtifacts]:
-        if not tickets:
-            return None
-
-        corpus: List[str] = []
-        for ticket in tickets:
-            text = f"{ticket.subject or ''} {ticket.description_text or ''}".strip().lower()
-            corpus.append(text)
-
-        if not any(corpus):
-            return None
-
-        token_docs: List[List[str]] = [self._raw_tokens(text) for text in corpus]
-        if not any(token_docs):
+    def _build_tfidf_artifacts(
+        self, tickets: List[TicketRecord], token_docs: List[List[str]]
+    ) -> Optional[_TfidfArtifacts]:
+        if not tickets or not any(token_docs):
             return None
 
         tokens_by_path: Dict[Tuple[str, ...], List[str]] = defaultdict(list)
@@ -602,10 +780,10 @@ class TicketAnalyzer:
                 if self.taxonomy.get_node(path_tuple):
                     tokens_by_path[path_tuple].extend(tokens)
 
-        doc_freq: Counter[str] = Counter()
-        for tokens in token_docs:
-            for token in set(tokens):
-                doc_freq[token] += 1
+        # Each document's term counts double as its distinct-token set for the
+        # document frequencies and are reused when building the ticket vectors.
+        doc_counts = [Counter(tokens) for tokens in token_docs]
+        doc_freq: Counter[str] = Counter(chain.from_iterable(doc_counts))
 
         doc_count = len(token_docs)
         if doc_count == 0 or not doc_freq:
@@ -616,22 +794,28 @@ class TicketAnalyzer:
             idf_map[token] = math.log((1 + doc_count) / (1 + freq)) + 1.0
         default_idf = math.log(1 + doc_count) + 1.0
 
-        ticket_vectors = [
-            self._build_tfidf_vector(tokens, idf_map=idf_map, default_idf=default_idf)
-            for tokens in token_docs
-        ]
+        # Tickets with identical token streams share one vector object, which lets
+        # the scoring pass below reuse their products as well.
+        vectors_by_doc: Dict[Tuple[str, ...], Dict[str, float]] = {}
+        ticket_vectors: List[Dict[str, float]] = []
+        for tokens, counts in zip(token_docs, doc_counts):
+            doc_key = tuple(tokens)
+            vector = vectors_by_doc.get(doc_key)
+            if vector is None:
+                vector = self._build_tfidf_vector(counts, idf_map=idf_map, default_idf=default_idf)
+                vectors_by_doc[doc_key] = vector
+            ticket_vectors.append(vector)
 
         prototype_paths: List[Tuple[str, ...]] = []
         prototype_vectors: List[Dict[str, float]] = []
+        node_keyword_tokens = self._node_keyword_tokens
         for path, node in self.taxonomy.nodes_by_path.items():
             if node.children:
                 continue
-            seed_tokens: List[str] = []
-            for keyword in node.keywords:
-                seed_tokens.extend(self._raw_tokens(keyword.lower()))
+            seed_tokens = list(node_keyword_tokens.get(path, ()))
             seed_tokens.extend(tokens_by_path.get(path, []))
             vector = self._build_tfidf_vector(
-                seed_tokens,
+                Counter(seed_tokens),
                 idf_map=idf_map,
                 default_idf=default_idf,
             )
@@ -650,20 +834,35 @@ class TicketAnalyzer:
         )
 
     def _compute_tfidf_scores(
-        self, tickets: List[TicketRecord]
+        self, tickets: List[TicketRecord], token_docs: List[List[str]]
     ) -> Optional[List[Dict[Tuple[str, ...], float]]]:
-        artifacts = self._build_tfidf_artifacts(tickets)
+        artifacts = self._build_tfidf_artifacts(tickets, token_docs)
         if artifacts is None:
             return None
+        # Invert the prototype vectors so each ticket only visits prototypes that
+        # share at least one token with it: a sparse ticket x prototype product.
+        postings: Dict[str, List[Tuple[Tuple[str, ...], float]]] = defaultdict(list)
+        for path, proto_vector in zip(artifacts.prototype_paths, artifacts.prototype_vectors):
+            for token, weight in proto_vector.items():
+                postings[token].append((path, weight))
+        # Vector weights are strictly positive, so every accumulated total is a
+        # non-zero score and the maps can be returned without a filtering pass.
+        postings_get = postings.get
         score_maps: List[Dict[Tuple[str, ...], float]] = []
+        # Score maps are only read downstream, so shared vectors share one map.
+        maps_by_vector: Dict[int, Dict[Tuple[str, ...], float]] = {}
         for ticket_vector in artifacts.ticket_vectors:
-            score_map: Dict[Tuple[str, ...], float] = {}
-            for index, path in enumerate(artifacts.prototype_paths):
-                proto_vector = artifacts.prototype_vectors[index]
-                value = self._cosine_similarity(ticket_vector, proto_vector)
-                if value > 0.0:
-                    score_map[path] = value
-            score_maps.append(score_map)
+            shared = maps_by_vector.get(id(ticket_vector))
+            if shared is not None:
+                score_maps.append(shared)
+                continue
+            totals: Dict[Tuple[str, ...], float] = {}
+            totals_get = totals.get
+            for token, weight in ticket_vector.items():
+                for path, proto_weight in postings_get(token, ()):
+                    totals[path] = totals_get(path, 0.0) + weight * proto_weight
+            maps_by_vector[id(ticket_vector)] = totals
+            score_maps.append(totals)
         return score_maps
 
     def _apply_tfidf_scores(
@@ -674,16 +873,19 @@ class TicketAnalyzer:
         if not tfidf_scores:
             return
 
+        get_node = self.taxonomy.get_node
+        tfidf_weight = self.tfidf_weight
+        leaf_threshold = self.tfidf_leaf_threshold
         for path, score in tfidf_scores.items():
             if score <= 0.0:
                 continue
-            node = self.taxonomy.get_node(path)
+            node = get_node(path)
             if not node:
                 continue
             if path in match_map:
                 match = match_map[path]
                 match.tfidf_score = max(match.tfidf_score, score)
-                match.confidence = round(min(match.confidence + score * self.tfidf_weight, 0.95), 2)
+                match.confidence = round(min(match.confidence + score * tfidf_weight, 0.95), 2)
                 if "tf-idf" in match.rationale:
                     match.rationale += f" ({score:.2f})"
                 else:
@@ -691,9 +893,9 @@ class TicketAnalyzer:
             else:
                 if node.children:
                     continue
-                if score < self.tfidf_leaf_threshold:
+                if score < leaf_threshold:
                     continue
-                confidence = round(min(0.5 + score * self.tfidf_weight, 0.9), 2)
+                confidence = round(min(0.5 + score * tfidf_weight, 0.9), 2)
                 rationale = f"Matched {' > '.join(path)} via tf-idf similarity {score:.2f}"
                 match_map[path] = _MatchResult(
                     path=path,
@@ -707,70 +909,61 @@ class TicketAnalyzer:
                     tfidf_score=score,
                 )
 
-    @staticmethod
-    def _cosine_similarity(vec_a: Dict[str, float], vec_b: Dict[str, float]) -> float:
-        if not vec_a or not vec_b:
-            return 0.0
-        if len(vec_a) > len(vec_b):
-            vec_a, vec_b = vec_b, vec_a
-        total = 0.0
-        for token, weight in vec_a.items():
-            other = vec_b.get(token)
-            if other:
-                total += weight * other
-        return total
-
     @staticmethod
     def _build_tfidf_vector(
-        tokens: Sequence[str],
+        counts: Counter[str],
         *,
         idf_map: Dict[str, float],
         default_idf: float,
     ) -> Dict[str, float]:
-        if not tokens:
-            return {}
-        counts = Counter(tokens)
-        total = sum(counts.values())
-        if total == 0:
+        if not counts:
             return {}
+        total = counts.total()
+        idf_get = idf_map.get
         weights: Dict[str, float] = {}
+        sum_squares = 0.0
         for token, count in counts.items():
-            tf = count / total
-            idf = idf_map.get(token, default_idf)
-            weight = tf * idf
+            weight = (count / total) * idf_get(token, default_idf)
             if weight > 0:
                 weights[token] = weight
+                sum_squares += weight * weight
         if not weights:
             return {}
-        norm = math.sqrt(sum(value * value for value in weights.values()))
+        norm = math.sqrt(sum_squares)
         if norm == 0:
             return {}
         return {token: value / norm for token, value in weights.items()}
 
-    def _sorted_matches(self, matches: Dict[Tuple[str, ...], _MatchResult]) -> List[_MatchResult]:
+    def _sorted_matches(
+        self, matches: Dict[Tuple[str, ...], _MatchResult], *, limit: Optional[int] = None
+    ) -> List[_MatchResult]:
+        priority_get = self.taxonomy.priority_map.get
         default_priority = len(self.taxonomy.priority_map) + 1
 
         def sort_key(result: _MatchResult) -> Tuple[int, int, float, Tuple[str, ...]]:
             if result.priority_override is not None:
                 priority_rank = result.priority_override
             else:
-                priority_rank = self.taxonomy.priority_map.get(result.path, default_priority)
+                priority_rank = priority_get(result.path, default_priority)
             depth = len(result.path)
             return (priority_rank, -depth, -result.confidence, result.path)
 
+        if limit is not None:
+            # Only the top suggestions are reported, so a partial selection suffices.
+            return heapq.nsmallest(limit, matches.values(), key=sort_key)
         return sorted(matches.values(), key=sort_key)
 
-    def _fallback_match(self) -> Optional[_MatchResult]:
-        target_path: Optional[Tuple[str, ...]] = None
+    def _find_fallback_path(self) -> Optional[Tuple[str, ...]]:
         for path in self.taxonomy.nodes_by_path:
             if len(path) >= 2 and path[0] == "General IT" and path[1] == "Questions":
-                target_path = path[:2]
-                break
-        if target_path is None:
-            for path in self.taxonomy.nodes_by_path:
-                if len(path) == 1 and path[0] == "General IT":
-                    target_path = path
-                    break
+                return path[:2]
+        for path in self.taxonomy.nodes_by_path:
+            if len(path) == 1 and path[0] == "General IT":
+                return path
+        return None
+
+    def _fallback_match(self) -> Optional[_MatchResult]:
+        target_path = self._fallback_path
         if target_path is None:
             return None
         depth = len(target_path)
@@ -784,110 +977,193 @@ class TicketAnalyzer:
             matched_regexes=[],
         )
 
+    def _classify_text(
+        self,
+        ticket_id: int,
+        text_lower: str,
+        raw_tokens: Sequence[str],
+        token_set: frozenset[str],
+        tfidf_map: Dict[Tuple[str, ...], float],
+    ) -> Tuple[List[SuggestedCategory], bool]:
+        """Return the ranked suggestions for a ticket's text and whether any path matched."""
+        match_map: Dict[Tuple[str, ...], _MatchResult] = {}
+        # Empty tickets cannot match anything, so they go straight to the fallback.
+        if text_lower:
+            match_map = self._match_taxonomy(text_lower=text_lower, token_set=token_set)
+            self._apply_proximity_boosts(match_map, raw_tokens)
+            self._apply_fuzzy_matches(match_map, raw_tokens, token_set)
+            self._apply_tfidf_scores(match_map, tfidf_map)
+            self._apply_negative_keywords(match_map, token_set, text_lower)
+        max_suggestions = self.max_suggestions_per_ticket
+        ordered_matches = self._sorted_matches(match_map, limit=max_suggestions)
+        # Any match within the first three levels makes the ticket classifiable.
+        primary: Optional[_MatchResult] = next(
+            (match for match in match_map.values() if len(match.path) <= 3), None
+        )
+        if primary is None:
+            fallback = self._fallback_match()
+            if fallback:
+                ordered_matches.insert(0, fallback)
+                primary = fallback
+        suggestion_list: List[SuggestedCategory] = []
+        debug_enabled = LOGGER.isEnabledFor(logging.DEBUG)
+        for match in ordered_matches[:max_suggestions]:
+            category, sub_category, item_category = (match.path + (None, None, None))[:3]
+            suggestion_list.append(
+                SuggestedCategory(
+                    category=category,
+                    sub_category=sub_category,
+                    item_category=item_category,
+                    confidence=match.confidence,
+                    rationale=match.rationale,
+                )
+            )
+            if debug_enabled:
+                LOGGER.debug(
+                    "Ticket %s matched path=%s confidence=%.2f details=%s",
+                    ticket_id,
+                    " > ".join(match.path),
+                    match.confidence,
+                    match.rationale,
+                )
+        return suggestion_list, primary is not None
+
+    @staticmethod
+    def _ticket_texts(tickets: Iterable[TicketRecord]) -> List[str]:
+        return [
+            f"{ticket.subject or ''} {ticket.description_text or ''}".strip() for ticket in tickets
+        ]
+
+    def _tokenize_texts(self, texts: Iterable[str]) -> List[TicketTokens]:
+        tokens_by_text: Dict[str, TicketTokens] = {}
+        tokenize = self._tokenize_once
+        tokenized = []
+        for text in texts:
+            entry = tokens_by_text.get(text)
+            if entry is None:
+                entry = tokens_by_text[text] = tokenize(text)
+            tokenized.append(entry)
+        return tokenized
+
+    def tokenize_tickets(self, tickets: Iterable[TicketRecord]) -> List[TicketTokens]:
+        """Tokenise each ticket's subject and description for the analysis passes.
+
+        The result lines up with ``tickets``; pass it as ``tokens`` to
+        :meth:`suggest_categories` and :meth:`detect_repeating_keywords` so a batch
+        is only tokenised once. Tickets with identical text share one entry, so
+        entries must not be mutated.
+        """
+        return self._tokenize_texts(self._ticket_texts(tickets))
+
+    @staticmethod
+    def _check_tokens(tokens: Sequence[TicketTokens], ticket_count: int) -> List[TicketTokens]:
+        tokenized = list(tokens)
+        if len(tokenized) != ticket_count:
+            raise ValueError(
+                f"Expected tokens for {ticket_count} tickets but received {len(tokenized)}"
+            )
+        return tokenized
+
     def suggest_categories(
         self,
         tickets: Iterable[TicketRecord],
         *,
+        tokens: Optional[Sequence[TicketTokens]] = None,
         progress_callback: Optional[Callable[[int, int], None]] = None,
     ) -> Dict[int, List[SuggestedCategory]]:
         ticket_list = list(tickets)
-        tfidf_scores = self._compute_tfidf_scores(ticket_list)
+        texts = self._ticket_texts(ticket_list)
+        if tokens is None:
+            tokenized = self._tokenize_texts(texts)
+        else:
+            tokenized = self._check_tokens(tokens, len(ticket_list))
+        tfidf_scores = self._compute_tfidf_scores(ticket_list, [raw for _, raw, _, _ in tokenized])
 
         suggestions: Dict[int, List[SuggestedCategory]] = {}
         total_tickets = len(ticket_list)
-        for index, ticket in enumerate(ticket_list, start=1):
-            subject = ticket.subject or ""
-            description = ticket.description_text or ""
-            combined_text = f"{subject} {description}".strip()
-            raw_tokens = self._raw_tokens(combined_text)
-            token_set = set(raw_tokens)
-            LOGGER.debug(
-                "Ticket %s classification input subject=%r description_excerpt=%r",
-                ticket.id,
-                subject,
-                (description or "")[:CLASSIFICATION_SNIPPET],
-            )
-            match_map = self._match_taxonomy(text=combined_text, token_set=token_set)
-            self._apply_proximity_boosts(match_map, raw_tokens)
-            self._apply_fuzzy_matches(match_map, raw_tokens, token_set)
-            tfidf_map: Dict[Tuple[str, ...], float] = {}
-            if tfidf_scores is not None:
-                tfidf_map = tfidf_scores[index - 1]
-            self._apply_tfidf_scores(match_map, tfidf_map)
-            self._apply_negative_keywords(match_map, raw_tokens, combined_text.lower())
-            ordered_matches = self._sorted_matches(match_map)
-            primary: Optional[_MatchResult] = None
-            for depth in (3, 2, 1):
-                for match in ordered_matches:
-                    if len(match.path) == depth:
-                        primary = match
-                        break
-                if primary:
-                    break
-            if primary is None:
-                fallback = self._fallback_match()
-                if fallback:
-                    ordered_matches.insert(0, fallback)
-                    primary = fallback
-            suggestion_list: List[SuggestedCategory] = []
-            for match in ordered_matches[: self.max_suggestions_per_ticket]:
-                category = match.path[0] if len(match.path) >= 1 else None
-                sub_category = match.path[1] if len(match.path) >= 2 else None
-                item_category = match.path[2] if len(match.path) >= 3 else None
-                suggestion_list.append(
-                    SuggestedCategory(
-                        category=category,
-                        sub_category=sub_category,
-                        item_category=item_category,
-                        confidence=round(match.confidence, 2),
-                        rationale=match.rationale,
-                    )
-                )
+        classified: Dict[str, Tuple[List[SuggestedCategory], bool]] = {}
+        # Log arguments below are costly to build, so skip them when filtered out.
+        debug_enabled = LOGGER.isEnabledFor(logging.DEBUG)
+        info_enabled = LOGGER.isEnabledFor(logging.INFO)
+        for index, (ticket, combined_text, (text_lower, raw_tokens, _, token_set)) in enumerate(
+            zip(ticket_list, texts, tokenized), start=1
+        ):
+            if debug_enabled:
                 LOGGER.debug(
-                    "Ticket %s matched path=%s confidence=%.2f details=%s",
+                    "Ticket %s classification input subject=%r description_excerpt=%r",
                     ticket.id,
-                    " > ".join(match.path),
-                    match.confidence,
-                    match.rationale,
+                    ticket.subject or "",
+                    (ticket.description_text or "")[:CLASSIFICATION_SNIPPET],
                 )
-            if primary:
+            cached = classified.get(combined_text)
+            if cached is not None:
+                # Identical text yields identical tokens and TF-IDF scores, so the
+                # earlier ticket's outcome applies unchanged.
+                cached_list, has_primary = cached
+                suggestion_list = list(cached_list)
+                if debug_enabled:
+                    LOGGER.debug("Ticket %s reuses the classification of identical text", ticket.id)
+            else:
+                tfidf_map = tfidf_scores[index - 1] if tfidf_scores is not None else {}
+                suggestion_list, has_primary = self._classify_text(
+                    ticket.id, text_lower, raw_tokens, token_set, tfidf_map
+                )
+                classified[combined_text] = (suggestion_list, has_primary)
+            if has_primary:
                 top = suggestion_list[0]
                 ticket.final_category = top.category or ""
                 ticket.final_sub_category = top.sub_category or ""
                 ticket.final_item_category = top.item_category or ""
-                path_summary = " > ".join(
-                    part for part in (top.category, top.sub_category, top.item_category) if part
-                ) or "<no category>"
-                LOGGER.info(
-                    "Ticket %s classified as %s (confidence %.2f)",
-                    ticket.id,
-                    path_summary,
-                    top.confidence,
-                )
+                if info_enabled:
+                    path_summary = " > ".join(
+                        part for part in (top.category, top.sub_category, top.item_category) if part
+                    ) or "<no category>"
+                    LOGGER.info(
+                        "Ticket %s classified as %s (confidence %.2f)",
+                        ticket.id,
+                        path_summary,
+                        top.confidence,
+                    )
             suggestions[ticket.id] = suggestion_list
             if progress_callback:
                 progress_callback(index, total_tickets)
         return suggestions
 
-    def detect_repeating_keywords(self, tickets: Iterable[TicketRecord]) -> List[Tuple[str, int]]:
-        counts = Counter()
-        for ticket in tickets:
-            tokens = self.tokenize(f"{ticket.subject or ''} {ticket.description_text or ''}")
-            counts.update(set(tokens))
-        repeating = [item for item in counts.items() if item[1] >= self.min_keyword_frequency]
-        repeating.sort(key=lambda item: item[1], reverse=True)
+    def detect_repeating_keywords(
+        self,
+        tickets: Iterable[TicketRecord],
+        *,
+        tokens: Optional[Sequence[TicketTokens]] = None,
+    ) -> List[Tuple[str, int]]:
+        ticket_list = list(tickets)
+        if tokens is None:
+            tokenized = self.tokenize_tickets(ticket_list)
+        else:
+            tokenized = self._check_tokens(tokens, len(ticket_list))
+        # One set of distinct keyword tokens per ticket, counted in a single Counter pass.
+        counts = Counter(chain.from_iterable(set(entry[2]) for entry in tokenized))
+        min_frequency = self.min_keyword_frequency
+        repeating = [item for item in counts.items() if item[1] >= min_frequency]
+        repeating.sort(key=itemgetter(1), reverse=True)
         LOGGER.info("Identified %s repeating keyword patterns", len(repeating))
         return repeating
 
     @staticmethod
     def extract_existing_categories(tickets: Iterable[TicketRecord]) -> Dict[str, set[str]]:
-        existing: Dict[str, set[str]] = defaultdict(set)
+        categories: set[str] = set()
+        sub_categories: set[str] = set()
+        item_categories: set[str] = set()
         for ticket in tickets:
             if ticket.category:
-                existing["category"].add(ticket.category)
+                categories.add(ticket.category)
             if ticket.sub_category:
-                existing["sub_category"].add(ticket.sub_category)
+                sub_categories.add(ticket.sub_category)
             if ticket.item_category:
-                existing["item_category"].add(ticket.item_category)
-        return existing
+                item_categories.add(ticket.item_category)
+        existing = {
+            "category": categories,
+            "sub_category": sub_categories,
+            "item_category": item_categories,
+        }
+        return {field_name: values for field_name, values in existing.items() if values}
 
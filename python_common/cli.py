@@ -0,0 +1,42 @@
+"""Command-line helpers shared by the platform entry points."""
+from __future__ import annotations
+
+import argparse
+
+from .config import DEFAULT_CONFIG_LOCATIONS
+
+# Built once from the same search list load_config walks, so --help never
+# touches the filesystem and always describes the real lookup order.
+DEFAULT_CONFIG_HELP = "the first existing file among " + ", ".join(
+    str(location) for location in DEFAULT_CONFIG_LOCATIONS
+)
+
+
+def common_parent_parser() -> argparse.ArgumentParser:
+    """Return the parent parser holding the configuration and console logging flags."""
+    parser = argparse.ArgumentParser(add_help=False)
+    parser.add_argument(
+        "--config",
+        help=f"Path to configuration YAML file. Defaults to {DEFAULT_CONFIG_HELP}.",
+    )
+    parser.add_argument(
+        "--disable-console-log",
+        action="store_true",
+        help="Disable console logging output (deprecated; logging is hidden unless --show-console-log is provided).",
+    )
+    parser.add_argument(
+        "--show-console-log",
+        action="store_true",
+        help="Show detailed log output instead of the default progress display.",
+    )
+    parser.add_argument(
+        "--simple-console",
+        action="store_true",
+        help="Use a simple console log format instead of Rich formatting.",
+    )
+    parser.add_argument(
+        "--console-level",
+        choices=["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"],
+        help="Override the console logging level.",
+    )
+    return parser
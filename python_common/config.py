@@ -1,13 +1,20 @@
 """Configuration helpers for Freshservice ticket analysis tools."""
 from __future__ import annotations
 
+import copy
 import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict
 
 import yaml
 
 
+# Prefer libyaml's C loader, which parses several times faster than the
+# pure-Python SafeLoader and accepts the same documents.
+_YAML_LOADER = getattr(yaml, "CSafeLoader", None) or getattr(yaml, "SafeLoader", None)
+
+
 class ConfigError(RuntimeError):
     """Raised when configuration cannot be loaded."""
 
@@ -36,9 +43,33 @@ def resolve_path(path_str: str | None, *, base: Path | None = None) -> Path:
     return path
 
 
+@lru_cache(maxsize=8)
+def _parse_config_file(
+    absolute_path: str, mtime_ns: int, size: int, inode: int
+) -> Dict[str, Any]:
+    """Parse a configuration file, memoised on its path and stat signature.
+
+    Size and inode are part of the key because coarse filesystem timestamps
+    can leave ``mtime_ns`` unchanged when a file is rewritten quickly.
+    """
+    with open(absolute_path, "r", encoding="utf-8") as handle:
+        try:
+            return yaml.load(handle, Loader=_YAML_LOADER) or {}
+        except yaml.YAMLError as exc:  # pragma: no cover - defensive
+            raise ConfigError(f"Unable to parse configuration file {absolute_path}") from exc
+
+
+def clear_config_cache() -> None:
+    """Forget every parsed configuration file so the next load reads from disk."""
+    _parse_config_file.cache_clear()
+
+
 def load_config(path: str | os.PathLike[str] | None = None) -> Dict[str, Any]:
     """Load configuration from YAML.
 
+    Parsed files are cached until they change on disk; each call returns an
+    independent copy so callers may mutate the result freely.
+
     Parameters
     ----------
     path: Optional path to a configuration file. If not provided, default
@@ -50,13 +81,17 @@ def load_config(path: str | os.PathLike[str] | None = None) -> Dict[str, Any]:
         candidate_paths = list(DEFAULT_CONFIG_LOCATIONS)
 
     for candidate in candidate_paths:
-        if candidate.exists():
-            with candidate.open("r", encoding="utf-8") as handle:
-                try:
-                    data = yaml.safe_load(handle) or {}
-                    return data
-                except yaml.YAMLError as exc:  # pragma: no cover - defensive
-                    raise ConfigError(f"Unable to parse configuration file {candidate}") from exc
+        try:
+            stat_result = candidate.stat()
+        except OSError:
+            continue
+        data = _parse_config_file(
+            os.fspath(candidate.absolute()),
+            stat_result.st_mtime_ns,
+            stat_result.st_size,
+            stat_result.st_ino,
+        )
+        return copy.deepcopy(data)
     raise ConfigError(
         "No configuration file could be located. Provide --config or create "
         "freshservice_ticket_insights/config/config.yaml (or config/config.yaml)."
@@ -2,11 +2,13 @@
 from __future__ import annotations
 
 import logging
+import threading
 import time
+from collections import deque
 from collections.abc import Iterable as IterableABC
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Any, Callable, Dict, Generator, Iterable, Optional, Sequence
-from urllib.parse import urljoin
+from typing import Any, Callable, Deque, Dict, Generator, Iterable, Optional, Sequence
 
 import requests
 
@@ -21,6 +23,38 @@ class FreshserviceAuth:
         return (self.api_key, "X")
 
 
+class _RateLimiter:
+    """Thread-safe token bucket allowing ``rate_per_minute`` requests per minute.
+
+    The bucket holds at most one second's worth of requests, so callers slower
+    than the limit never wait while bursts cannot overshoot the per-minute
+    budget by more than that second.
+    """
+
+    def __init__(self, rate_per_minute: float) -> None:
+        self.refill_per_second = rate_per_minute / 60.0
+        self.capacity = max(1.0, self.refill_per_second)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Take one request slot and return how long the caller must wait for it."""
+
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.capacity, self._tokens + (now - self._updated) * self.refill_per_second
+            )
+            self._updated = now
+            self._tokens -= 1.0
+            if self._tokens >= 0:
+                return 0.0
+            # The deficit is reserved, so concurrent callers queue behind each other
+            # while sleeping outside the lock.
+            return -self._tokens / self.refill_per_second
+
+
 class FreshserviceClient:
     """Wrapper around the Freshservice API used for tickets and metadata."""
 
@@ -33,6 +67,7 @@ class FreshserviceClient:
         timeout: int = 30,
         per_page: int = 100,
         rate_limit_per_minute: Optional[int] = None,
+        prefetch_pages: int = 1,
     ) -> None:
         self.base_url = self._normalise_base_url(base_url)
         if self.base_url.rstrip("/") != base_url.rstrip("/"):
@@ -49,17 +84,25 @@ class FreshserviceClient:
         self.timeout = timeout
         self.per_page = min(max(per_page, 30), 100)  # API maximum is 100
         self.rate_limit_per_minute = rate_limit_per_minute
+        # Bulk updates reuse the per-request interval as their back-off after a 429.
         self._sleep_between_requests = (
             60.0 / rate_limit_per_minute if rate_limit_per_minute else 0.0
         )
-        self._last_request_time: float | None = None
+        self._rate_limiter = (
+            _RateLimiter(rate_limit_per_minute) if rate_limit_per_minute else None
+        )
+        # Number of list pages kept in flight while paginating; 1 keeps the
+        # original strictly sequential behaviour.
+        self.prefetch_pages = max(1, int(prefetch_pages))
+        self._adapter = self._mount_pooled_adapter(self.session, self.prefetch_pages)
+        # Prefetch workers each get their own session; see _open_worker_session.
+        self._thread_state = threading.local()
 
     # -- Low level request helpers -------------------------------------------------
     def _request(self, method: str, path: str, **kwargs: Any) -> Dict[str, Any]:
         url = self._build_url(path)
-        if self._sleep_between_requests and self._last_request_time is not None:
-            elapsed = time.monotonic() - self._last_request_time
-            remaining = self._sleep_between_requests - elapsed
+        if self._rate_limiter is not None:
+            remaining = self._rate_limiter.reserve()
             if remaining > 0:
                 LOGGER.debug(
                     "Sleeping %.2fs before %s %s to respect rate limits",
@@ -69,20 +112,46 @@ class FreshserviceClient:
                 )
                 time.sleep(remaining)
         LOGGER.debug("HTTP %s %s payload=%s", method, url, kwargs.get("json"))
-        response = self.session.request(
+        session = getattr(self._thread_state, "session", self.session)
+        response = session.request(
             method,
             url,
             timeout=self.timeout,
             verify=self.verify_ssl,
             **kwargs,
         )
-        self._last_request_time = time.monotonic()
         LOGGER.debug("Response status=%s", response.status_code)
         response.raise_for_status()
         if response.content:
             return response.json()
         return {}
 
+    @staticmethod
+    def _mount_pooled_adapter(session: requests.Session, pool_size: int) -> Any:
+        """Keep one reusable connection per prefetch worker."""
+
+        from requests.adapters import HTTPAdapter
+
+        adapter = HTTPAdapter(pool_maxsize=pool_size)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return adapter
+
+    def _open_worker_session(self) -> None:
+        """Give the calling prefetch thread a session of its own.
+
+        ``requests.Session`` is not thread-safe, so workers copy the auth and
+        headers of the main session instead of sharing it. They do share its
+        connection pool, which urllib3 guards with its own locking.
+        """
+
+        session = requests.Session()
+        session.auth = self.session.auth
+        session.headers.update(self.session.headers)
+        session.mount("https://", self._adapter)
+        session.mount("http://", self._adapter)
+        self._thread_state.session = session
+
     def _normalise_base_url(self, base_url: str) -> str:
         """Trim common API suffixes and return a clean base domain."""
 
@@ -94,11 +163,79 @@ class FreshserviceClient:
         return cleaned or base_url.rstrip("/")
 
     def _build_url(self, path: str) -> str:
-        """Safely join the base URL and request path."""
+        """Safely join the base URL and request path.
+
+        Request paths are always relative API routes, so plain concatenation
+        gives the same result as ``urljoin`` without re-parsing both URLs.
+        """
+
+        return self.base_url.rstrip("/") + "/" + path.lstrip("/")
+
+    def _iter_paginated(
+        self,
+        path: str,
+        collection_key: str,
+        extra_params: Dict[str, Any],
+        *,
+        progress_callback: Optional[Callable[[int, Optional[int]], None]],
+    ) -> Generator[Dict[str, Any], None, None]:
+        """Yield items from a paginated list endpoint in page order.
+
+        With ``prefetch_pages`` above one, and once the first page reports
+        ``meta.total_items``, the following pages are requested concurrently
+        while earlier pages are being consumed. Without a total the pages are
+        fetched one at a time.
+        """
 
-        normalised_path = path.lstrip("/")
-        base = self.base_url.rstrip("/") + "/"
-        return urljoin(base, normalised_path)
+        def fetch(page_number: int) -> Dict[str, Any]:
+            params: Dict[str, Any] = {"per_page": self.per_page, "page": page_number}
+            params.update(extra_params)
+            return self._request("GET", path, params=params)
+
+        page = 1
+        processed = 0
+        total_estimate: Optional[int] = None
+        executor: Optional[ThreadPoolExecutor] = None
+        pending: Deque[Future] = deque()
+        last_submitted = 1
+        try:
+            payload = fetch(page)
+            while True:
+                items = payload.get(collection_key, []) if isinstance(payload, dict) else []
+                meta = payload.get("meta") if isinstance(payload, dict) else None
+                if isinstance(meta, dict):
+                    total_value = meta.get("total_items")
+                    if isinstance(total_value, int) and total_value >= 0:
+                        total_estimate = total_value
+                LOGGER.info("Fetched %s %s from page %s", len(items), collection_key, page)
+                yield from items
+                processed += len(items)
+                if progress_callback:
+                    progress_callback(processed, total_estimate)
+                if len(items) < self.per_page:
+                    break
+                page += 1
+                if self.prefetch_pages > 1 and total_estimate is not None:
+                    last_page = -(-total_estimate // self.per_page)
+                    if executor is None:
+                        executor = ThreadPoolExecutor(
+                            max_workers=self.prefetch_pages,
+                            thread_name_prefix="freshservice-prefetch",
+                            initializer=self._open_worker_session,
+                        )
+                    while last_submitted < min(page + self.prefetch_pages - 1, last_page):
+                        last_submitted += 1
+                        pending.append(executor.submit(fetch, last_submitted))
+                if pending:
+                    payload = pending.popleft().result()
+                else:
+                    payload = fetch(page)
+                    last_submitted = page
+        finally:
+            for future in pending:
+                future.cancel()
+            if executor is not None:
+                executor.shutdown(wait=True)
 
     # -- Public API ----------------------------------------------------------------
     def iter_tickets(
@@ -114,34 +251,14 @@ class FreshserviceClient:
         processed with ``(processed_count, total_estimate)`` so callers can
         render progress indicators.
         """
-        page = 1
-        processed = 0
-        total_estimate: Optional[int] = None
-        while True:
-            params: Dict[str, Any] = {"per_page": self.per_page, "page": page}
-            if updated_since:
-                params["updated_since"] = updated_since
-            if include:
-                params["include"] = ",".join(sorted(set(include)))
-            payload = self._request("GET", "/api/v2/tickets", params=params)
-            tickets = payload.get("tickets", [])
-            meta = payload.get("meta") if isinstance(payload, dict) else None
-            if isinstance(meta, dict):
-                total_value = meta.get("total_items")
-                if isinstance(total_value, int) and total_value >= 0:
-                    total_estimate = total_value
-            LOGGER.info("Fetched %s tickets from page %s", len(tickets), page)
-            for ticket in tickets:
-                yield ticket
-            processed += len(tickets)
-            if progress_callback:
-                progress_callback(processed, total_estimate)
-            if len(tickets) < self.per_page:
-                break
-            page += 1
-            if self._sleep_between_requests:
-                LOGGER.debug("Sleeping %.2fs to respect rate limits", self._sleep_between_requests)
-                time.sleep(self._sleep_between_requests)
+        params: Dict[str, Any] = {}
+        if updated_since:
+            params["updated_since"] = updated_since
+        if include:
+            params["include"] = ",".join(sorted(set(include)))
+        yield from self._iter_paginated(
+            "/api/v2/tickets", "tickets", params, progress_callback=progress_callback
+        )
 
     def get_ticket(self, ticket_id: int) -> Dict[str, Any]:
         payload = self._request("GET", f"/api/v2/tickets/{ticket_id}")
@@ -215,34 +332,12 @@ class FreshserviceClient:
             textual progress updates.
         """
 
-        page = 1
-        processed = 0
-        total_estimate: Optional[int] = None
-        while True:
-            params: Dict[str, Any] = {"per_page": self.per_page, "page": page}
-            if updated_since:
-                params["updated_since"] = updated_since
-            payload = self._request("GET", "/api/v2/requesters", params=params)
-            requesters = payload.get("requesters", []) if isinstance(payload, dict) else []
-            meta = payload.get("meta") if isinstance(payload, dict) else None
-            if isinstance(meta, dict):
-                total_value = meta.get("total_items")
-                if isinstance(total_value, int) and total_value >= 0:
-                    total_estimate = total_value
-            LOGGER.info("Fetched %s requesters from page %s", len(requesters), page)
-            for requester in requesters:
-                yield requester
-            processed += len(requesters)
-            if progress_callback:
-                progress_callback(processed, total_estimate)
-            if len(requesters) < self.per_page:
-                break
-            page += 1
-            if self._sleep_between_requests:
-                LOGGER.debug(
-                    "Sleeping %.2fs to respect rate limits", self._sleep_between_requests
-                )
-                time.sleep(self._sleep_between_requests)
+        params: Dict[str, Any] = {}
+        if updated_since:
+            params["updated_since"] = updated_since
+        yield from self._iter_paginated(
+            "/api/v2/requesters", "requesters", params, progress_callback=progress_callback
+        )
 
     def get_requester(self, requester_id: int) -> Dict[str, Any]:
         payload = self._request("GET", f"/api/v2/requesters/{requester_id}")
@@ -1,10 +1,13 @@
 """Logging configuration for Freshservice scripts."""
 from __future__ import annotations
 
+import atexit
 import logging
+import queue
 import sys
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 from .config import resolve_path
 
@@ -15,10 +18,27 @@ except Exception:  # pragma: no cover - fall back to standard logging
     RichHandler = None  # type: ignore
     _RICH_AVAILABLE = False
 
+_FILE_LISTENER: Optional[QueueListener] = None
+
+
+def _stop_file_listener() -> None:
+    """Drain queued file records and stop the background writer thread."""
+    global _FILE_LISTENER
+    if _FILE_LISTENER is not None:
+        _FILE_LISTENER.stop()
+        for handler in _FILE_LISTENER.handlers:
+            handler.close()
+        _FILE_LISTENER = None
+
+
+atexit.register(_stop_file_listener)
+
 
 def configure_logging(config: Dict[str, Any], *, base_dir: Path | None = None) -> None:
     """Configure logging sinks based on YAML configuration."""
+    global _FILE_LISTENER
     logging.captureWarnings(True)
+    _stop_file_listener()
     logging.getLogger().handlers.clear()
     logging.getLogger().setLevel(logging.DEBUG)
 
@@ -51,4 +71,12 @@ def configure_logging(config: Dict[str, Any], *, base_dir: Path | None = None) -
             datefmt="%Y-%m-%d %H:%M:%S",
         )
         handler.setFormatter(formatter)
-        logging.getLogger().addHandler(handler)
+        # The file sink defaults to DEBUG, so per-ticket records only pay for an
+        # enqueue; a listener thread formats and writes them. Console output stays
+        # synchronous so it keeps its order relative to progress lines.
+        records: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+        queue_handler = QueueHandler(records)
+        queue_handler.setLevel(handler.level)
+        _FILE_LISTENER = QueueListener(records, handler, respect_handler_level=True)
+        _FILE_LISTENER.start()
+        logging.getLogger().addHandler(queue_handler)
@@ -3,41 +3,45 @@ from __future__ import annotations
 
 import json
 import logging
-from collections import Counter, defaultdict
-from dataclasses import dataclass
-from datetime import datetime, timezone
+from bisect import bisect_right
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta, timezone
 from importlib import import_module
 from pathlib import Path
 from statistics import mean
 from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
 from dateutil import parser as date_parser
 from fpdf import FPDF
-from fpdf.errors import FPDFException
+from fpdf.enums import XPos, YPos
 from jinja2 import Template
 
 LOGGER = logging.getLogger(__name__)
 
+# Upper bounds (inclusive, in days) of every aging bucket but the last.
+_AGING_BOUNDS = (1, 3, 7, 14)
+_AGING_LABELS = ("0-1 days", "1-3 days", "3-7 days", "7-14 days", "14+ days")
+_RESOLVED_STATUSES = frozenset({4, 5, 6})
+
 
 def _parse_datetime(value: Optional[str]) -> Optional[datetime]:
     if not value:
         return None
     try:
-        dt = date_parser.isoparse(value)
-    except (ValueError, TypeError):
-        return None
+        # Freshservice stamps are plain ISO 8601, which the C parser handles; only
+        # unusual forms need dateutil. Python 3.10 rejects a "Z" suffix, hence the swap.
+        dt = datetime.fromisoformat(value[:-1] + "+00:00" if value.endswith("Z") else value)
+    except (ValueError, TypeError, AttributeError):
+        try:
+            dt = date_parser.isoparse(value)
+        except (ValueError, TypeError):
+            return None
     if dt.tzinfo is None:
         dt = dt.replace(tzinfo=timezone.utc)
     return dt.astimezone(timezone.utc)
 
 
-def _hours_between(start: Optional[datetime], end: Optional[datetime]) -> Optional[float]:
-    if not start or not end:
-        return None
-    delta = end - start
-    return max(delta.total_seconds() / 3600.0, 0.0)
-
-
-@dataclass
+@dataclass(slots=True)
 class TicketSnapshot:
     """Lightweight normalised view of Freshservice ticket data."""
 
@@ -118,11 +122,12 @@ class TicketSnapshot:
 
     @property
     def is_resolved(self) -> bool:
+        # Computed on access so it follows later changes to resolved_at or status.
         if self.resolved_at:
             return True
         if self.status is None:
             return False
-        return int(self.status) in {4, 5, 6}
+        return int(self.status) in _RESOLVED_STATUSES
 
     @property
     def is_open(self) -> bool:
@@ -133,23 +138,215 @@ class TicketSnapshot:
         return max((reference - self.created_at).total_seconds() / 86400.0, 0.0)
 
 
+@dataclass(slots=True)
+class _GroupStats:
+    """Running totals for one agent or department."""
+
+    tickets: int = 0
+    resolved: int = 0
+    resolution_hours: List[float] = field(default_factory=list)
+    first_response_hours: List[float] = field(default_factory=list)
+
+
+@dataclass
+class _ReportAggregates:
+    """Accumulators shared by every metric, filled in one pass over the tickets."""
+
+    ticket_count: int = 0
+    # Keyed by calendar day; ISO strings are only built for the distinct days.
+    daily_created: Counter[date] = field(default_factory=Counter)
+    daily_resolved: Counter[date] = field(default_factory=Counter)
+    sla_total: int = 0
+    sla_met: int = 0
+    sla_breaches: List[int] = field(default_factory=list)
+    # Creation times of open tickets; ages are judged against cut-offs derived from now.
+    open_created: List[Tuple[int, datetime]] = field(default_factory=list)
+    high_priority_open: List[int] = field(default_factory=list)
+    agents: Dict[str, _GroupStats] = field(default_factory=dict)
+    departments: Dict[str, _GroupStats] = field(default_factory=dict)
+    first_responses: List[float] = field(default_factory=list)
+    resolutions: List[float] = field(default_factory=list)
+    ratings: List[float] = field(default_factory=list)
+    rating_timeline: Dict[date, List[float]] = field(default_factory=dict)
+    missing_department: int = 0
+    missing_responder: int = 0
+    taxonomy: Counter[Tuple[Optional[str], Optional[str], Optional[str]]] = field(
+        default_factory=Counter
+    )
+    lifecycle_hours: List[float] = field(default_factory=list)
+    reopen_total: int = 0
+    tickets_reopened: int = 0
+    # Raw responder/department ID -> group record, kept so later batches reuse them.
+    agents_by_id: Dict[Any, _GroupStats] = field(default_factory=dict, repr=False)
+    departments_by_id: Dict[Any, _GroupStats] = field(default_factory=dict, repr=False)
+
+
 class TicketReportBuilder:
-    """Aggregate Freshservice tickets into operational and strategic metrics."""
+    """Aggregate Freshservice tickets into operational and strategic metrics.
+
+    Aggregates and the :meth:`build` result are cached. Extend the batch with
+    :meth:`add_tickets`; after changing ``tickets`` or a snapshot in place, call
+    :meth:`invalidate` so the next read recomputes.
+    """
 
     def __init__(self, tickets: Sequence[TicketSnapshot], now: Optional[datetime] = None) -> None:
-        self.tickets = list(tickets)
+        self.tickets: List[TicketSnapshot] = list(tickets)
         self.now = now or datetime.utcnow().replace(tzinfo=timezone.utc)
+        # Cached results remember the reference time they were computed at, so
+        # assigning a new ``now`` also forces a rebuild.
+        self._agg: Optional[_ReportAggregates] = None
+        self._agg_now: Optional[datetime] = None
+        self._metrics: Optional[Dict[str, Any]] = None
+        self._metrics_now: Optional[datetime] = None
+
+    def invalidate(self) -> None:
+        """Drop cached aggregates and metrics after tickets were changed in place."""
+
+        self._agg = None
+        self._metrics = None
+
+    def _age_cutoff(self, days: float) -> datetime:
+        return self.now - timedelta(days=days)
+
+    def _open_older_than(self, agg: _ReportAggregates, days: float) -> List[int]:
+        if days <= 0:
+            # Ages are clamped at zero, so every open ticket qualifies.
+            return [ticket_id for ticket_id, _ in agg.open_created]
+        cutoff = self._age_cutoff(days)
+        return [ticket_id for ticket_id, created in agg.open_created if created <= cutoff]
+
+    def _compute_all(self) -> _ReportAggregates:
+        """Walk the tickets once and fill the accumulators every metric reads from."""
+
+        if self._agg is not None and self._agg_now == self.now:
+            return self._agg
+        agg = _ReportAggregates()
+        self._accumulate(agg, self.tickets)
+        self._agg = agg
+        self._agg_now = self.now
+        return agg
+
+    def add_tickets(self, tickets: Iterable[TicketSnapshot]) -> None:
+        """Append newly observed tickets, folding them into existing aggregates.
+
+        Only the new tickets are walked when metrics were already computed for
+        the current batch; otherwise aggregation happens lazily as usual.
+        """
+
+        new_tickets = list(tickets)
+        if not new_tickets:
+            return
+        agg = self._agg if self._agg_now == self.now else None
+        self.tickets.extend(new_tickets)
+        self._metrics = None
+        if agg is None:
+            self._agg = None
+            return
+        self._accumulate(agg, new_tickets)
+
+    def _accumulate(self, agg: _ReportAggregates, tickets: Sequence[TicketSnapshot]) -> None:
+        now = self.now
+        agents_by_id = agg.agents_by_id
+        departments_by_id = agg.departments_by_id
+        # Durations are computed inline rather than through per-ticket helper
+        # calls: created_at is always set, so only the end needs a check.
+        for ticket in tickets:
+            agg.ticket_count += 1
+            created = ticket.created_at
+            resolved_at = ticket.resolved_at
+            created_day = created.date()
+            agg.daily_created[created_day] += 1
+            if resolved_at:
+                agg.daily_resolved[resolved_at.date()] += 1
+
+            if ticket.due_by:
+                agg.sla_total += 1
+                if (resolved_at or now) <= ticket.due_by:
+                    agg.sla_met += 1
+                else:
+                    agg.sla_breaches.append(ticket.ticket_id)
+
+            resolved = ticket.is_resolved
+            if not resolved:
+                agg.open_created.append((ticket.ticket_id, created))
+                if (ticket.priority or 0) >= 3:
+                    agg.high_priority_open.append(ticket.ticket_id)
+
+            first_responded_at = ticket.first_responded_at
+            res_hours = (
+                max((resolved_at - created).total_seconds() / 3600.0, 0.0) if resolved_at else None
+            )
+            first_hours = (
+                max((first_responded_at - created).total_seconds() / 3600.0, 0.0)
+                if first_responded_at
+                else None
+            )
+            if res_hours is not None:
+                agg.resolutions.append(res_hours)
+            if first_hours is not None:
+                agg.first_responses.append(first_hours)
+
+            # IDs repeat heavily, so the string group key is built once per raw ID.
+            responder_id = ticket.responder_id
+            agent = agents_by_id.get(responder_id)
+            if agent is None:
+                agent_key = str(responder_id or "Unassigned")
+                agent = agg.agents.get(agent_key)
+                if agent is None:
+                    agent = agg.agents[agent_key] = _GroupStats()
+                agents_by_id[responder_id] = agent
+            department_id = ticket.department_id
+            department = departments_by_id.get(department_id)
+            if department is None:
+                department_key = str(department_id or "Unassigned")
+                department = agg.departments.get(department_key)
+                if department is None:
+                    department = agg.departments[department_key] = _GroupStats()
+                departments_by_id[department_id] = department
+            agent.tickets += 1
+            department.tickets += 1
+            if resolved:
+                agent.resolved += 1
+                department.resolved += 1
+            if res_hours is not None:
+                agent.resolution_hours.append(res_hours)
+                department.resolution_hours.append(res_hours)
+            if first_hours is not None:
+                agent.first_response_hours.append(first_hours)
+
+            rating = ticket.satisfaction_rating
+            if rating is not None:
+                agg.ratings.append(rating)
+                agg.rating_timeline.setdefault(created_day, []).append(rating)
+
+            if department_id is None:
+                agg.missing_department += 1
+            if responder_id is None:
+                agg.missing_responder += 1
+
+            end_time = resolved_at or ticket.closed_at or now
+            agg.lifecycle_hours.append(max((end_time - created).total_seconds() / 3600.0, 0.0))
+            reopened_count = ticket.reopened_count
+            if reopened_count:
+                agg.reopen_total += reopened_count
+                agg.tickets_reopened += 1
+        # Every category-based metric is derived from this one counter, so the
+        # per-ticket cost is a single C-level count over the category triples.
+        agg.taxonomy.update(
+            (ticket.category, ticket.sub_category, ticket.item_category) for ticket in tickets
+        )
 
     # -- Operational metrics -------------------------------------------------
     def ticket_volume_trend(self) -> Dict[str, Any]:
-        daily_counter: Counter[str] = Counter()
-        resolved_counter: Counter[str] = Counter()
-        for ticket in self.tickets:
-            daily_counter[ticket.created_at.date().isoformat()] += 1
-            if ticket.resolved_at:
-                resolved_counter[ticket.resolved_at.date().isoformat()] += 1
+        agg = self._compute_all()
+        daily_counter = agg.daily_created
+        resolved_counter = agg.daily_resolved
         trend = [
-            {"date": day, "created": daily_counter[day], "resolved": resolved_counter.get(day, 0)}
+            {
+                "date": day.isoformat(),
+                "created": daily_counter[day],
+                "resolved": resolved_counter.get(day, 0),
+            }
             for day in sorted(daily_counter)
         ]
         return {
@@ -159,84 +356,44 @@ class TicketReportBuilder:
         }
 
     def sla_compliance(self) -> Dict[str, Any]:
-        total = 0
-        met = 0
-        breaches: List[int] = []
-        for ticket in self.tickets:
-            if not ticket.due_by:
-                continue
-            total += 1
-            resolved = ticket.resolved_at or self.now
-            if resolved <= ticket.due_by:
-                met += 1
-            else:
-                breaches.append(ticket.ticket_id)
-        breach_count = total - met
+        agg = self._compute_all()
+        total = agg.sla_total
+        met = agg.sla_met
         compliance = (met / total) if total else 0.0
         return {
             "tickets_with_sla": total,
             "met": met,
-            "breached": breach_count,
+            "breached": total - met,
             "compliance_rate": round(compliance, 3),
-            "breached_ticket_ids": breaches,
+            "breached_ticket_ids": list(agg.sla_breaches),
         }
 
     def backlog_and_aging(self) -> Dict[str, Any]:
-        open_tickets = [t for t in self.tickets if t.is_open]
-        buckets = {
-            "0-1 days": 0,
-            "1-3 days": 0,
-            "3-7 days": 0,
-            "7-14 days": 0,
-            "14+ days": 0,
-        }
-        for ticket in open_tickets:
-            age = ticket.age_in_days(self.now)
-            if age <= 1:
-                buckets["0-1 days"] += 1
-            elif age <= 3:
-                buckets["1-3 days"] += 1
-            elif age <= 7:
-                buckets["3-7 days"] += 1
-            elif age <= 14:
-                buckets["7-14 days"] += 1
-            else:
-                buckets["14+ days"] += 1
+        open_created = self._compute_all().open_created
+        # A ticket is older than N days exactly when it was created before now - N
+        # days, so bucketing compares datetimes against the cut-offs directly.
+        cutoffs = sorted(self._age_cutoff(days) for days in _AGING_BOUNDS)
+        last_bucket = len(cutoffs)
+        counts = [0] * len(_AGING_LABELS)
+        for _, created in open_created:
+            counts[last_bucket - bisect_right(cutoffs, created)] += 1
+        buckets = dict(zip(_AGING_LABELS, counts))
         return {
-            "open_tickets": len(open_tickets),
+            "open_tickets": len(open_created),
             "aging_buckets": buckets,
         }
 
     def agent_performance(self) -> List[Dict[str, Any]]:
-        metrics: Dict[str, Dict[str, Any]] = defaultdict(lambda: {
-            "tickets_resolved": 0,
-            "tickets_open": 0,
-            "resolution_hours": [],
-            "first_response_hours": [],
-        })
-        for ticket in self.tickets:
-            agent_key = str(ticket.responder_id or "Unassigned")
-            entry = metrics[agent_key]
-            if ticket.is_resolved:
-                entry["tickets_resolved"] += 1
-            else:
-                entry["tickets_open"] += 1
-            res_hours = _hours_between(ticket.created_at, ticket.resolved_at)
-            if res_hours is not None:
-                entry["resolution_hours"].append(res_hours)
-            first_hours = _hours_between(ticket.created_at, ticket.first_responded_at)
-            if first_hours is not None:
-                entry["first_response_hours"].append(first_hours)
         results: List[Dict[str, Any]] = []
-        for agent, data in metrics.items():
+        for agent, data in self._compute_all().agents.items():
             results.append(
                 {
                     "agent": agent,
-                    "tickets_resolved": data["tickets_resolved"],
-                    "tickets_open": data["tickets_open"],
-                    "avg_resolution_hours": round(mean(data["resolution_hours"]) if data["resolution_hours"] else 0.0, 2),
+                    "tickets_resolved": data.resolved,
+                    "tickets_open": data.tickets - data.resolved,
+                    "avg_resolution_hours": round(mean(data.resolution_hours) if data.resolution_hours else 0.0, 2),
                     "avg_first_response_hours": round(
-                        mean(data["first_response_hours"]) if data["first_response_hours"] else 0.0,
+                        mean(data.first_response_hours) if data.first_response_hours else 0.0,
                         2,
                     ),
                 }
@@ -248,13 +405,14 @@ class TicketReportBuilder:
         category_counter: Counter[str] = Counter()
         subcategory_counter: Counter[Tuple[str, str]] = Counter()
         item_counter: Counter[Tuple[str, str, str]] = Counter()
-        for ticket in self.tickets:
-            if ticket.category:
-                category_counter[ticket.category] += 1
-            if ticket.category and ticket.sub_category:
-                subcategory_counter[(ticket.category, ticket.sub_category)] += 1
-            if ticket.category and ticket.sub_category and ticket.item_category:
-                item_counter[(ticket.category, ticket.sub_category, ticket.item_category)] += 1
+        for (category, sub_category, item_category), count in self._compute_all().taxonomy.items():
+            if not category:
+                continue
+            category_counter[category] += count
+            if sub_category:
+                subcategory_counter[(category, sub_category)] += count
+                if item_category:
+                    item_counter[(category, sub_category, item_category)] += count
         return {
             "categories": category_counter,
             "subcategories": subcategory_counter,
@@ -262,15 +420,10 @@ class TicketReportBuilder:
         }
 
     def response_resolution_summary(self) -> Dict[str, Any]:
-        first_responses: List[float] = []
-        resolutions: List[float] = []
-        for ticket in self.tickets:
-            first = _hours_between(ticket.created_at, ticket.first_responded_at)
-            if first is not None:
-                first_responses.append(first)
-            resolved = _hours_between(ticket.created_at, ticket.resolved_at)
-            if resolved is not None:
-                resolutions.append(resolved)
+        agg = self._compute_all()
+        first_responses = agg.first_responses
+        resolutions = agg.resolutions
+
         def _average(values: Sequence[float]) -> float:
             return round(mean(values), 2) if values else 0.0
 
@@ -283,47 +436,23 @@ class TicketReportBuilder:
 
     # -- Strategic metrics ---------------------------------------------------
     def service_risk_indicators(self) -> Dict[str, Any]:
-        breached = self.sla_compliance()["breached_ticket_ids"]
-        high_priority_open = [
-            ticket.ticket_id
-            for ticket in self.tickets
-            if ticket.is_open and (ticket.priority or 0) >= 3
-        ]
-        aging = [
-            ticket.ticket_id
-            for ticket in self.tickets
-            if ticket.is_open and ticket.age_in_days(self.now) >= 14
-        ]
+        agg = self._compute_all()
         return {
-            "sla_breaches": breached,
-            "high_priority_open": high_priority_open,
-            "aging_open_tickets": aging,
+            "sla_breaches": list(agg.sla_breaches),
+            "high_priority_open": list(agg.high_priority_open),
+            "aging_open_tickets": self._open_older_than(agg, 14),
         }
 
     def department_impact(self) -> List[Dict[str, Any]]:
-        metrics: Dict[str, Dict[str, Any]] = defaultdict(lambda: {
-            "tickets": 0,
-            "resolved": 0,
-            "resolution_hours": [],
-        })
-        for ticket in self.tickets:
-            department = str(ticket.department_id or "Unassigned")
-            entry = metrics[department]
-            entry["tickets"] += 1
-            if ticket.is_resolved:
-                entry["resolved"] += 1
-            resolved_hours = _hours_between(ticket.created_at, ticket.resolved_at)
-            if resolved_hours is not None:
-                entry["resolution_hours"].append(resolved_hours)
         report: List[Dict[str, Any]] = []
-        for dept, data in metrics.items():
-            avg_resolution = round(mean(data["resolution_hours"]) if data["resolution_hours"] else 0.0, 2)
+        for dept, data in self._compute_all().departments.items():
+            avg_resolution = round(mean(data.resolution_hours) if data.resolution_hours else 0.0, 2)
             report.append(
                 {
                     "department": dept,
-                    "tickets": data["tickets"],
-                    "resolved": data["resolved"],
-                    "resolution_rate": round(data["resolved"] / data["tickets"], 3) if data["tickets"] else 0.0,
+                    "tickets": data.tickets,
+                    "resolved": data.resolved,
+                    "resolution_rate": round(data.resolved / data.tickets, 3) if data.tickets else 0.0,
                     "avg_resolution_hours": avg_resolution,
                 }
             )
@@ -332,13 +461,13 @@ class TicketReportBuilder:
 
     def recurring_incidents(self, min_occurrences: int = 5) -> List[Dict[str, Any]]:
         counter: Counter[str] = Counter()
-        for ticket in self.tickets:
-            key_parts = [ticket.category or "Unclassified"]
-            if ticket.sub_category:
-                key_parts.append(ticket.sub_category)
-            if ticket.item_category:
-                key_parts.append(ticket.item_category)
-            counter[" > ".join(key_parts)] += 1
+        for (category, sub_category, item_category), count in self._compute_all().taxonomy.items():
+            key_parts = [category or "Unclassified"]
+            if sub_category:
+                key_parts.append(sub_category)
+            if item_category:
+                key_parts.append(item_category)
+            counter[" > ".join(key_parts)] += count
         return [
             {"path": path, "count": count}
             for path, count in counter.most_common()
@@ -346,16 +475,11 @@ class TicketReportBuilder:
         ]
 
     def satisfaction_trends(self) -> Dict[str, Any]:
-        ratings: List[float] = []
-        timeline: Dict[str, List[float]] = defaultdict(list)
-        for ticket in self.tickets:
-            if ticket.satisfaction_rating is None:
-                continue
-            ratings.append(ticket.satisfaction_rating)
-            timeline[ticket.created_at.date().isoformat()].append(ticket.satisfaction_rating)
+        agg = self._compute_all()
+        ratings = agg.ratings
         trend = [
-            {"date": day, "average_rating": round(mean(scores), 2), "responses": len(scores)}
-            for day, scores in sorted(timeline.items())
+            {"date": day.isoformat(), "average_rating": round(mean(scores), 2), "responses": len(scores)}
+            for day, scores in sorted(agg.rating_timeline.items())
         ]
         return {
             "response_count": len(ratings),
@@ -367,7 +491,10 @@ class TicketReportBuilder:
         agent_metrics = self.agent_performance()
         if not agent_metrics:
             return {"agents": [], "average_tickets_resolved": 0.0}
-        avg_resolved = mean(agent["tickets_resolved"] for agent in agent_metrics)
+        total_resolved = sum(agent["tickets_resolved"] for agent in agent_metrics)
+        quotient, remainder = divmod(total_resolved, len(agent_metrics))
+        # Whole-number averages stay ints, matching the previous statistics.mean output.
+        avg_resolved = total_resolved / len(agent_metrics) if remainder else quotient
         return {
             "agents": agent_metrics,
             "average_tickets_resolved": round(avg_resolved, 2),
@@ -375,17 +502,13 @@ class TicketReportBuilder:
 
     # -- Technical / audit metrics ------------------------------------------
     def data_quality_audit(self) -> Dict[str, Any]:
-        missing_category = 0
-        missing_department = 0
-        missing_responder = 0
-        for ticket in self.tickets:
-            if not ticket.category:
-                missing_category += 1
-            if ticket.department_id is None:
-                missing_department += 1
-            if ticket.responder_id is None:
-                missing_responder += 1
-        total = len(self.tickets) or 1
+        agg = self._compute_all()
+        missing_category = sum(
+            count for (category, _, _), count in agg.taxonomy.items() if not category
+        )
+        missing_department = agg.missing_department
+        missing_responder = agg.missing_responder
+        total = agg.ticket_count or 1
         return {
             "missing_category": missing_category,
             "missing_department": missing_department,
@@ -396,9 +519,6 @@ class TicketReportBuilder:
         }
 
     def taxonomy_usage(self) -> List[Dict[str, Any]]:
-        counter: Counter[Tuple[str, Optional[str], Optional[str]]] = Counter()
-        for ticket in self.tickets:
-            counter[(ticket.category, ticket.sub_category, ticket.item_category)] += 1
         usage = [
             {
                 "category": cat or "Unclassified",
@@ -406,37 +526,46 @@ class TicketReportBuilder:
                 "item_category": item or "",
                 "count": count,
             }
-            for (cat, sub, item), count in counter.most_common()
+            for (cat, sub, item), count in self._compute_all().taxonomy.most_common()
         ]
         return usage
 
     def stale_and_breaches(self, stale_days: int = 14) -> Dict[str, Any]:
-        stale: List[int] = []
-        breached: List[int] = []
-        for ticket in self.tickets:
-            if ticket.is_open and ticket.age_in_days(self.now) >= stale_days:
-                stale.append(ticket.ticket_id)
-            if ticket.due_by and (ticket.resolved_at or self.now) > ticket.due_by:
-                breached.append(ticket.ticket_id)
-        return {"stale_tickets": stale, "sla_breaches": breached}
+        agg = self._compute_all()
+        stale = self._open_older_than(agg, stale_days)
+        return {"stale_tickets": stale, "sla_breaches": list(agg.sla_breaches)}
 
     def lifecycle_and_reopens(self) -> Dict[str, Any]:
-        lifecycle_hours: List[float] = []
-        reopen_counts: List[int] = []
-        for ticket in self.tickets:
-            end_time = ticket.resolved_at or ticket.closed_at or self.now
-            lifecycle = _hours_between(ticket.created_at, end_time)
-            if lifecycle is not None:
-                lifecycle_hours.append(lifecycle)
-            reopen_counts.append(ticket.reopened_count)
+        agg = self._compute_all()
+        lifecycle_hours = agg.lifecycle_hours
+        ticket_count = agg.ticket_count
+        average_reopens: float = 0.0
+        if ticket_count:
+            quotient, remainder = divmod(agg.reopen_total, ticket_count)
+            # Whole-number averages stay ints, matching the previous statistics.mean output.
+            average_reopens = round(agg.reopen_total / ticket_count, 2) if remainder else quotient
         return {
             "average_lifecycle_hours": round(mean(lifecycle_hours), 2) if lifecycle_hours else 0.0,
             "max_lifecycle_hours": round(max(lifecycle_hours), 2) if lifecycle_hours else 0.0,
-            "tickets_reopened": sum(1 for count in reopen_counts if count),
-            "average_reopens": round(mean(reopen_counts), 2) if reopen_counts else 0.0,
+            "tickets_reopened": agg.tickets_reopened,
+            "average_reopens": average_reopens,
         }
 
     def build(self) -> Dict[str, Any]:
+        """Return every metric.
+
+        The result is cached until :meth:`add_tickets`, :meth:`invalidate` or a new
+        ``now`` changes the input, and the same dict is returned to every caller,
+        so treat it as read-only.
+        """
+
+        if self._metrics is not None and self._metrics_now == self.now:
+            return self._metrics
+        self._metrics = self._build_metrics()
+        self._metrics_now = self.now
+        return self._metrics
+
+    def _build_metrics(self) -> Dict[str, Any]:
         return {
             "generated_at": self.now.isoformat(),
             "operational": {
@@ -601,7 +730,7 @@ def render_html(metrics: Dict[str, Any], filters: Dict[str, Any], output_path: P
 class _PDFReport(FPDF):
     def header(self) -> None:  # pragma: no cover - simple layout call
         self.set_font("Helvetica", "B", 14)
-        self.cell(0, 10, "Freshservice Reporting Suite", ln=1, align="C")
+        self.cell(0, 10, "Freshservice Reporting Suite", new_x=XPos.LMARGIN, new_y=YPos.NEXT, align="C")
         self.ln(5)
 
 
@@ -611,25 +740,25 @@ def render_pdf(metrics: Dict[str, Any], filters: Dict[str, Any], output_path: Pa
     pdf.add_page()
     pdf.set_font("Helvetica", size=10)
 
-    pdf.multi_cell(0, 6, f"Generated: {metrics['generated_at']}")
+    header_lines = [f"Generated: {metrics['generated_at']}"]
     if filters.get("start_date"):
-        pdf.multi_cell(0, 6, f"Start Date: {filters['start_date']}")
+        header_lines.append(f"Start Date: {filters['start_date']}")
     if filters.get("end_date"):
-        pdf.multi_cell(0, 6, f"End Date: {filters['end_date']}")
+        header_lines.append(f"End Date: {filters['end_date']}")
     if filters.get("categories"):
-        pdf.multi_cell(0, 6, "Categories: " + ", ".join(filters["categories"]))
+        header_lines.append("Categories: " + ", ".join(filters["categories"]))
+    pdf.multi_cell(0, 6, "\n".join(header_lines), new_x=XPos.LMARGIN, new_y=YPos.NEXT)
     pdf.ln(4)
 
     def _section(title: str, body: Iterable[str]) -> None:
         pdf.set_font("Helvetica", "B", 12)
-        pdf.cell(0, 8, title, ln=1)
+        pdf.cell(0, 8, title, new_x=XPos.LMARGIN, new_y=YPos.NEXT)
         pdf.set_font("Helvetica", size=10)
-        for line in body:
-            try:
-                pdf.cell(0, 5, line, ln=1)
-            except FPDFException:
-                trimmed = line if len(line) < 120 else line[:117] + "..."
-                pdf.cell(0, 5, trimmed, ln=1)
+        # One wrapped block per section; over-long lines are shortened up front so
+        # each entry still reads as a single row.
+        lines = [line if len(line) < 120 else line[:117] + "..." for line in body]
+        if lines:
+            pdf.multi_cell(0, 5, "\n".join(lines), new_x=XPos.LMARGIN, new_y=YPos.NEXT)
         pdf.ln(2)
 
     _section(
@@ -672,49 +801,46 @@ def render_pdf(metrics: Dict[str, Any], filters: Dict[str, Any], output_path: Pa
     pdf.output(str(output_path))
 
 
-def _get_pyplot():  # pragma: no cover - thin wrapper around matplotlib import
-    matplotlib = import_module("matplotlib")
-    if hasattr(matplotlib, "use"):
-        try:
-            matplotlib.use("Agg")
-        except Exception:  # pragma: no cover - defensive fallback
-            pass
-    return import_module("matplotlib.pyplot")
+def _new_figure(figsize: Tuple[float, float]) -> Any:  # pragma: no cover - thin wrapper around matplotlib import
+    # Figures built directly (rather than through pyplot) skip pyplot's global figure
+    # manager and render with the Agg canvas when saved to PNG.
+    figure_module = import_module("matplotlib.figure")
+    return figure_module.Figure(figsize=figsize)
 
 
 def _plot_line_chart(data: List[Dict[str, Any]], output_path: Path) -> None:
     if not data:
         return
-    plt = _get_pyplot()
     dates = [datetime.fromisoformat(row["date"]) for row in data]
     created = [row["created"] for row in data]
     resolved = [row["resolved"] for row in data]
-    plt.figure(figsize=(10, 4))
-    plt.plot(dates, created, label="Created", marker="o")
-    plt.plot(dates, resolved, label="Resolved", marker="o")
-    plt.xlabel("Date")
-    plt.ylabel("Tickets")
-    plt.title("Ticket Volume Trend")
-    plt.legend()
-    plt.tight_layout()
-    plt.savefig(output_path)
-    plt.close()
+    figure = _new_figure((10, 4))
+    axes = figure.subplots()
+    axes.plot(dates, created, label="Created", marker="o")
+    axes.plot(dates, resolved, label="Resolved", marker="o")
+    axes.set_xlabel("Date")
+    axes.set_ylabel("Tickets")
+    axes.set_title("Ticket Volume Trend")
+    axes.legend()
+    figure.tight_layout()
+    figure.savefig(output_path)
 
 
 def _plot_bar_chart(counter: Counter[Any], output_path: Path, title: str, max_items: int = 10) -> None:
     if not counter:
         return
-    plt = _get_pyplot()
     most_common = counter.most_common(max_items)
     labels = [str(label) for label, _ in most_common]
     values = [count for _, count in most_common]
-    plt.figure(figsize=(10, 4))
-    plt.bar(labels, values, color="#1f77b4")
-    plt.xticks(rotation=45, ha="right")
-    plt.title(title)
-    plt.tight_layout()
-    plt.savefig(output_path)
-    plt.close()
+    figure = _new_figure((10, 4))
+    axes = figure.subplots()
+    axes.bar(labels, values, color="#1f77b4")
+    for tick_label in axes.get_xticklabels():
+        tick_label.set_rotation(45)
+        tick_label.set_horizontalalignment("right")
+    axes.set_title(title)
+    figure.tight_layout()
+    figure.savefig(output_path)
 
 
 def render_images(metrics: Dict[str, Any], output_dir: Path) -> List[Path]:
@@ -743,9 +869,16 @@ def _stringify_key(key: Any) -> str:
     return str(key)
 
 
+def _counter_to_dict(counter: Counter[Any]) -> Dict[str, Any]:
+    # Counter values are plain counts, so only the keys need converting.
+    if all(type(key) is str for key in counter):
+        return dict(counter)
+    return {_stringify_key(key): count for key, count in counter.items()}
+
+
 def _json_default(value: Any) -> Any:
     if isinstance(value, Counter):
-        return {_stringify_key(key): count for key, count in value.items()}
+        return _counter_to_dict(value)
     if isinstance(value, Path):
         return str(value)
     if isinstance(value, datetime):
@@ -753,20 +886,41 @@ def _json_default(value: Any) -> Any:
     return str(value)
 
 
+_JSON_LEAF_TYPES = frozenset({str, int, float, bool, type(None)})
+
+
 def _normalise_for_json(value: Any) -> Any:
-    if isinstance(value, Counter):
-        return {_stringify_key(k): _normalise_for_json(v) for k, v in value.items()}
-    if isinstance(value, dict):
-        return {str(k): _normalise_for_json(v) for k, v in value.items()}
-    if isinstance(value, list):
-        return [_normalise_for_json(item) for item in value]
-    if isinstance(value, tuple):
-        return [_normalise_for_json(item) for item in value]
-    if isinstance(value, datetime):
-        return value.isoformat()
-    if isinstance(value, Path):
-        return str(value)
-    return value
+    # Walk containers with an explicit stack so deeply nested metrics cannot hit
+    # the recursion limit. Each entry names the slot its converted value fills.
+    root: List[Any] = [value]
+    pending: List[Tuple[Any, Any, Any]] = [(root, 0, value)]
+    while pending:
+        parent, slot, item = pending.pop()
+        # Most metric values are plain scalars; an exact type check settles them
+        # before walking the isinstance chain.
+        if type(item) in _JSON_LEAF_TYPES:
+            parent[slot] = item
+        elif isinstance(item, Counter):
+            parent[slot] = _counter_to_dict(item)
+        elif isinstance(item, dict):
+            converted = {str(k): v for k, v in item.items()}
+            parent[slot] = converted
+            pending.extend(
+                (converted, k, v) for k, v in converted.items() if type(v) not in _JSON_LEAF_TYPES
+            )
+        elif isinstance(item, (list, tuple)):
+            items = list(item)
+            parent[slot] = items
+            pending.extend(
+                (items, i, v) for i, v in enumerate(items) if type(v) not in _JSON_LEAF_TYPES
+            )
+        elif isinstance(item, datetime):
+            parent[slot] = item.isoformat()
+        elif isinstance(item, Path):
+            parent[slot] = str(item)
+        else:
+            parent[slot] = item
+    return root[0]
 
 
 def save_metrics_json(metrics: Dict[str, Any], output_path: Path) -> None:
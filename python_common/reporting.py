@@ -4,12 +4,19 @@ from __future__ import annotations
 import csv
 import logging
 from pathlib import Path
-from typing import Dict, Iterable, List, Sequence
+from typing import Dict, Iterable, Iterator, List, Sequence
 
 from .analysis import SuggestedCategory, TicketRecord
 
 LOGGER = logging.getLogger(__name__)
 
+# Report files run to many megabytes; a larger buffer means far fewer write calls.
+_CSV_BUFFER_SIZE = 1 << 20
+
+# Suggestion columns for tickets without a suggestion: category, sub-category,
+# item category, confidence and rationale.
+_BLANK_SUGGESTION_COLUMNS = ("", "", "", "", "")
+
 
 class TicketReportWriter:
     """Persist ticket analysis output for review."""
@@ -53,58 +60,100 @@ class TicketReportWriter:
         report_path = self.output_directory / self.report_name
         keyword_lookup = {keyword: frequency for keyword, frequency in repeating_keywords}
         LOGGER.info("Writing ticket analysis report to %s", report_path)
-        with report_path.open("w", encoding="utf-8", newline="") as handle:
+        with report_path.open(
+            "w", encoding="utf-8", newline="", buffering=_CSV_BUFFER_SIZE
+        ) as handle:
             writer = csv.writer(handle)
             writer.writerow(self.HEADERS)
-            for ticket in tickets:
-                suggestion_list = suggestions.get(ticket.id, [])
-                suggestion = suggestion_list[0] if suggestion_list else None
-                keyword, frequency = self._pick_repeating_keyword(ticket, keyword_lookup)
-                writer.writerow(
-                    [
-                        ticket.id,
-                        ticket.subject,
-                        ticket.description_text,
-                        ticket.created_at_utc or "",
-                        ticket.category,
-                        ticket.sub_category,
-                        ticket.item_category,
-                        suggestion.category if suggestion else "",
-                        suggestion.sub_category if suggestion else "",
-                        suggestion.item_category if suggestion else "",
-                        suggestion.confidence if suggestion else "",
-                        suggestion.rationale if suggestion else "",
-                        ticket.final_category,
-                        ticket.final_sub_category,
-                        ticket.final_item_category,
-                        keyword,
-                        frequency,
-                    ]
-                )
+            writer.writerows(self._iter_rows(tickets, suggestions, keyword_lookup))
         return report_path
 
+    def _iter_rows(
+        self,
+        tickets: Iterable[TicketRecord],
+        suggestions: Dict[int, List[SuggestedCategory]],
+        keyword_lookup: Dict[str, int],
+    ) -> Iterator[tuple]:
+        suggestions_get = suggestions.get
+        pick_keyword = self._pick_repeating_keyword
+        for ticket in tickets:
+            suggestion_list = suggestions_get(ticket.id)
+            if suggestion_list:
+                suggestion = suggestion_list[0]
+                suggestion_columns: tuple = (
+                    suggestion.category,
+                    suggestion.sub_category,
+                    suggestion.item_category,
+                    suggestion.confidence,
+                    suggestion.rationale,
+                )
+            else:
+                suggestion_columns = _BLANK_SUGGESTION_COLUMNS
+            keyword, frequency = pick_keyword(ticket, keyword_lookup)
+            yield (
+                ticket.id,
+                ticket.subject,
+                ticket.description_text,
+                ticket.created_at_utc or "",
+                ticket.category,
+                ticket.sub_category,
+                ticket.item_category,
+                *suggestion_columns,
+                ticket.final_category,
+                ticket.final_sub_category,
+                ticket.final_item_category,
+                keyword,
+                frequency,
+            )
+
     def create_review_template(self, analysis_path: Path) -> Path:
         review_path = analysis_path.with_name(analysis_path.stem + "_review.csv")
         LOGGER.info("Creating review template at %s", review_path)
-        with analysis_path.open("r", encoding="utf-8", newline="") as input_handle, review_path.open(
-            "w", encoding="utf-8", newline=""
+        with analysis_path.open(
+            "r", encoding="utf-8", newline="", buffering=_CSV_BUFFER_SIZE
+        ) as input_handle, review_path.open(
+            "w", encoding="utf-8", newline="", buffering=_CSV_BUFFER_SIZE
         ) as output_handle:
-            reader = csv.DictReader(input_handle)
-            writer = csv.DictWriter(output_handle, fieldnames=self.REVIEW_HEADERS)
-            writer.writeheader()
-            for row in reader:
-                row.update({
-                    "manager_decision": "pending",
-                    "final_category": row.get("final_category") or row.get("suggested_category", ""),
-                    "final_sub_category": row.get("final_sub_category")
-                    or row.get("suggested_sub_category", ""),
-                    "final_item_category": row.get("final_item_category")
-                    or row.get("suggested_item_category", ""),
-                    "review_notes": "",
-                })
-                writer.writerow(row)
+            reader = csv.reader(input_handle)
+            writer = csv.writer(output_handle)
+            writer.writerow(self.REVIEW_HEADERS)
+            header = next(reader, None)
+            if header is not None:
+                writer.writerows(self._iter_review_rows(reader, header))
         return review_path
 
+    def _iter_review_rows(self, reader: Iterator[List[str]], header: List[str]) -> Iterator[List[str]]:
+        idx = {name: i for i, name in enumerate(self.HEADERS)}
+        width = len(self.HEADERS)
+        # Map each report column to its position in the source file so that a
+        # hand-edited analysis CSV with reordered or missing columns still lines up.
+        source = {name: i for i, name in enumerate(header)}
+        in_order = header[:width] == list(self.HEADERS)
+        positions = [source.get(name) for name in self.HEADERS]
+        defaults = [
+            (idx[final], idx[suggested])
+            for final, suggested in (
+                ("final_category", "suggested_category"),
+                ("final_sub_category", "suggested_sub_category"),
+                ("final_item_category", "suggested_item_category"),
+            )
+        ]
+        for row in reader:
+            if not row:
+                continue
+            if in_order:
+                row = row[:width]
+                if len(row) < width:
+                    row.extend([""] * (width - len(row)))
+            else:
+                row = [row[i] if i is not None and i < len(row) else "" for i in positions]
+            for final, suggested in defaults:
+                if not row[final]:
+                    row[final] = row[suggested]
+            row.append("pending")
+            row.append("")
+            yield row
+
     @staticmethod
     def _pick_repeating_keyword(ticket: TicketRecord, keyword_lookup: Dict[str, int]) -> tuple[str, int]:
         text = f"{ticket.subject} {ticket.description_text}".lower()
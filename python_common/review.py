@@ -3,12 +3,25 @@ from __future__ import annotations
 
 import csv
 import logging
+import sys
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Iterable, List, Optional
 
 LOGGER = logging.getLogger(__name__)
 
+_ACTIONABLE_DECISIONS = frozenset({"approve", "decline", "skip", "pending"})
+# Free-text worksheet columns, in ReviewRow field order.
+_TEXT_COLUMNS = (
+    "final_category",
+    "final_sub_category",
+    "final_item_category",
+    "review_notes",
+    "current_category",
+    "current_sub_category",
+    "current_item_category",
+)
+
 
 @dataclass
 class ReviewRow:
@@ -34,31 +47,52 @@ class ReviewWorksheet:
         rows: List[ReviewRow] = []
         LOGGER.info("Loading review worksheet from %s", self.review_csv)
         with self.review_csv.open("r", encoding="utf-8", newline="") as handle:
-            reader = csv.DictReader(handle)
+            reader = csv.reader(handle)
+            header = next(reader, None)
+            if header is None:
+                return rows
+            index = {name: position for position, name in enumerate(header)}
+            decision_at = index.get("manager_decision")
+            id_at = index.get("ticket_id")
+            text_at = [index.get(name) for name in _TEXT_COLUMNS]
+            confidence_at = index.get("suggestion_confidence")
             for row in reader:
-                decision = (row.get("manager_decision") or "").strip().lower()
-                if decision not in {"approve", "decline", "skip", "pending"}:
-                    LOGGER.debug("Ticket %s has non-actionable decision '%s'", row.get("ticket_id"), decision)
+                if not row:
+                    continue
+                width = len(row)
+                if width < len(header):
+                    # Short rows read as blank cells, as csv.DictReader did.
+                    row = row + [""] * (len(header) - width)
+                decision = row[decision_at].strip().lower() if decision_at is not None else ""
+                if decision not in _ACTIONABLE_DECISIONS:
+                    LOGGER.debug(
+                        "Ticket %s has non-actionable decision '%s'",
+                        row[id_at] if id_at is not None else None,
+                        decision,
+                    )
                     continue
+                text = [row[position].strip() if position is not None else "" for position in text_at]
                 rows.append(
                     ReviewRow(
-                        ticket_id=int(row.get("ticket_id", 0)),
-                        manager_decision=decision,
-                        final_category=(row.get("final_category") or "").strip(),
-                        final_sub_category=(row.get("final_sub_category") or "").strip(),
-                        final_item_category=(row.get("final_item_category") or "").strip(),
-                        review_notes=(row.get("review_notes") or "").strip(),
-                        current_category=(row.get("current_category") or "").strip(),
-                        current_sub_category=(row.get("current_sub_category") or "").strip(),
-                        current_item_category=(row.get("current_item_category") or "").strip(),
-                        suggestion_confidence=_safe_float(row.get("suggestion_confidence")),
+                        ticket_id=int(row[id_at]) if id_at is not None else 0,
+                        manager_decision=sys.intern(decision),
+                        final_category=text[0],
+                        final_sub_category=text[1],
+                        final_item_category=text[2],
+                        review_notes=text[3],
+                        current_category=text[4],
+                        current_sub_category=text[5],
+                        current_item_category=text[6],
+                        suggestion_confidence=_safe_float(row[confidence_at])
+                        if confidence_at is not None
+                        else None,
                     )
                 )
         return rows
 
     @staticmethod
     def filter_rows(rows: Iterable[ReviewRow], *, include_decisions: Iterable[str]) -> List[ReviewRow]:
-        include = {decision.lower() for decision in include_decisions}
+        include = frozenset(decision.lower() for decision in include_decisions)
         return [row for row in rows if row.manager_decision in include]
 
 
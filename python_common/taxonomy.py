@@ -3,11 +3,14 @@ from __future__ import annotations
 
 import logging
 import re
+import sys
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
 
 LOGGER = logging.getLogger(__name__)
 TOKEN_PATTERN = re.compile(r"[A-Za-z0-9_]+")
+_CAMEL_PATTERN = re.compile(r"[A-Z]+(?=[A-Z][a-z])|[A-Z]?[a-z]+|\d+")
 
 _VENDOR_EXPANSIONS: Dict[str, List[str]] = {
     "ms": ["microsoft"],
@@ -38,7 +41,7 @@ def _normalise_priority_path(path: Any) -> Tuple[str, ...]:
     return tuple(part for part in parts if part)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AliasRule:
     alias: str
     target_path: Tuple[str, ...]
@@ -47,7 +50,7 @@ class AliasRule:
     regex: Optional[re.Pattern[str]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class TaxonomyNode:
     label: str
     path: Tuple[str, ...]
@@ -58,9 +61,12 @@ class TaxonomyNode:
     children: List["TaxonomyNode"] = field(default_factory=list)
 
     def iter_nodes(self) -> Iterator["TaxonomyNode"]:
-        yield self
-        for child in self.children:
-            yield from child.iter_nodes()
+        # Depth-first, parents before children, without a generator per level.
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            yield node
+            stack.extend(reversed(node.children))
 
 
 @dataclass
@@ -80,6 +86,11 @@ class TaxonomyModel:
         return self.nodes_by_path.get(path)
 
 
+@lru_cache(maxsize=2048)
+def _compile_ci(pattern: str) -> re.Pattern[str]:
+    return re.compile(pattern, re.IGNORECASE)
+
+
 def _build_node(
     entry: Dict[str, Any],
     *,
@@ -93,7 +104,8 @@ def _build_node(
     label = entry["label"]
     if not isinstance(label, str) or not label.strip():
         raise ValueError("Taxonomy node labels must be non-empty strings")
-    label = label.strip()
+    # Labels repeat across subtrees; interning shares one object per distinct label.
+    label = sys.intern(label.strip())
     path = parent_path + (label,)
     if len(path) > max_depth:
         raise ValueError(
@@ -101,14 +113,14 @@ def _build_node(
         )
 
     keywords = _derive_label_keywords(label, extras=entry.get("keywords"))
-    regexes = [re.compile(pattern, re.IGNORECASE) for pattern in entry.get("regexes", [])]
+    regexes = [_compile_ci(pattern) for pattern in entry.get("regexes", [])]
     alias_list = [str(alias) for alias in entry.get("aliases", [])]
 
     node = TaxonomyNode(
         label=label,
         path=path,
         keywords=keywords,
-        keyword_norms=[keyword.lower() for keyword in keywords],
+        keyword_norms=_keyword_norms(keywords),
         regexes=regexes,
         aliases=alias_list,
         children=[],
@@ -157,7 +169,7 @@ def _parse_alias_rules(
         note = entry.get("note")
         pattern: Optional[re.Pattern[str]] = None
         if entry.get("regex"):
-            pattern = re.compile(alias, re.IGNORECASE)
+            pattern = _compile_ci(alias)
         alias_rules.append(
             AliasRule(alias=alias, target_path=target_path, legacy=legacy, note=note, regex=pattern)
         )
@@ -267,7 +279,7 @@ def _build_model_from_metadata(
     def _ensure_node(label: Optional[str], parent_path: Tuple[str, ...]) -> Optional[TaxonomyNode]:
         if label is None:
             return None
-        text = str(label).strip()
+        text = sys.intern(str(label).strip())
         if not text:
             return None
         path = parent_path + (text,)
@@ -283,7 +295,7 @@ def _build_model_from_metadata(
                 label=text,
                 path=path,
                 keywords=keywords,
-                keyword_norms=[keyword.lower() for keyword in keywords],
+                keyword_norms=_keyword_norms(keywords),
                 regexes=[],
                 aliases=[],
                 children=[],
@@ -332,22 +344,26 @@ def _build_model_from_metadata(
 
 
 def _derive_label_keywords(label: str, extras: Optional[Iterable[str]] = None) -> List[str]:
+    extra_terms = tuple(str(value) for value in extras) if extras else None
+    # Nodes own their keyword lists, so hand out a fresh copy of the cached result.
+    return list(_label_keywords(label, extra_terms))
+
+
+@lru_cache(maxsize=4096)
+def _label_keywords(label: str, extras: Optional[Tuple[str, ...]]) -> Tuple[str, ...]:
     tokens = _split_label_tokens(label)
-    keywords: List[str] = []
-    seen: set[str] = set()
+    # Lower-cased form -> first spelling seen; dicts keep insertion order.
+    keywords: Dict[str, str] = {}
 
-    def _add(term: str) -> None:
-        norm = term.strip().lower()
-        if not norm:
-            return
-        if norm not in seen:
-            keywords.append(term.strip())
-            seen.add(norm)
+    def _add(term: str) -> str:
+        text = term.strip()
+        norm = text.lower()
+        if norm and norm not in keywords:
+            keywords[norm] = text
+        return norm
 
     def _add_with_aliases(term: str) -> None:
-        _add(term)
-        norm = term.strip().lower()
-        for alias in _SIMPLE_ALIASES.get(norm, []):
+        for alias in _SIMPLE_ALIASES.get(_add(term), ()):
             _add(alias)
 
     base = label.strip()
@@ -378,12 +394,17 @@ def _derive_label_keywords(label: str, extras: Optional[Iterable[str]] = None) -
 
     if extras:
         for value in extras:
-            _add_with_aliases(str(value))
+            _add_with_aliases(value)
+
+    return tuple(keywords.values())
+
 
-    return keywords
+def _keyword_norms(keywords: Iterable[str]) -> List[str]:
+    return [sys.intern(keyword.lower()) for keyword in keywords]
 
 
-def _split_label_tokens(label: str) -> List[str]:
+@lru_cache(maxsize=4096)
+def _split_label_tokens(label: str) -> Tuple[str, ...]:
     raw_tokens = TOKEN_PATTERN.findall(label)
     tokens: List[str] = []
 
@@ -392,16 +413,17 @@ def _split_label_tokens(label: str) -> List[str]:
             lowered = part.lower()
             if lowered:
                 tokens.append(lowered)
-    return tokens
+    return tuple(tokens)
 
 
-def _split_camel_case(token: str) -> List[str]:
-    pattern = re.compile(r"[A-Z]+(?=[A-Z][a-z])|[A-Z]?[a-z]+|\d+")
-    parts = pattern.findall(token)
-    return parts or [token]
+@lru_cache(maxsize=4096)
+def _split_camel_case(token: str) -> Tuple[str, ...]:
+    parts = _CAMEL_PATTERN.findall(token)
+    return tuple(parts) or (token,)
 
 
-def _delimiter_variants(text: str) -> List[str]:
+@lru_cache(maxsize=4096)
+def _delimiter_variants(text: str) -> Tuple[str, ...]:
     variants: List[str] = []
     lowered = text.lower()
     for source, replacements in (("-", [" ", ""]), (" ", ["-", ""]), ("/", [" ", "-"])):
@@ -410,10 +432,11 @@ def _delimiter_variants(text: str) -> List[str]:
                 variant = text.replace(source, replacement)
                 if variant.lower() != lowered:
                     variants.append(variant)
-    return variants
+    return tuple(variants)
 
 
-def _plural_forms(token: str) -> List[str]:
+@lru_cache(maxsize=4096)
+def _plural_forms(token: str) -> Tuple[str, ...]:
     forms: List[str] = []
     if token.endswith("s") and len(token) > 1:
         forms.append(token[:-1])
@@ -421,4 +444,4 @@ def _plural_forms(token: str) -> List[str]:
         if token.endswith("y"):
             forms.append(token[:-1] + "ies")
         forms.append(token + "s")
-    return forms
+    return tuple(forms)
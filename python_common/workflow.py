@@ -253,6 +253,7 @@ def _create_client(config: dict) -> FreshserviceClient:
         timeout=int(fs_cfg.get("timeout", 30)),
         per_page=int(fs_cfg.get("per_page", 100)),
         rate_limit_per_minute=fs_cfg.get("rate_limit_per_minute"),
+        prefetch_pages=int(fs_cfg.get("prefetch_pages", 1)),
     )
     return client
 
@@ -311,14 +312,16 @@ def fetch_and_analyze(options: FetchAnalyzeOptions, *, base_dir: Optional[Path]
         keyword_overrides=analysis_cfg.get("keyword_overrides", {}),
     )
 
+    # Both analysis passes read the same tokens, so tokenise the batch once.
+    ticket_tokens = analyzer.tokenize_tickets(ticket_records)
     analysis_progress = _ProgressTask("Analyzing tickets", progress_enabled)
     try:
         suggestions = analyzer.suggest_categories(
-            ticket_records, progress_callback=analysis_progress.update
+            ticket_records, tokens=ticket_tokens, progress_callback=analysis_progress.update
         )
     finally:
         analysis_progress.done()
-    repeating = analyzer.detect_repeating_keywords(ticket_records)
+    repeating = analyzer.detect_repeating_keywords(ticket_records, tokens=ticket_tokens)
 
     existing_categories = TicketAnalyzer.extract_existing_categories(ticket_records)
     _log_taxonomy(existing_categories, repeating)
@@ -9,6 +9,8 @@ import sys
 from datetime import datetime
 from importlib import util
 
+import pytest
+
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
 ANALYSIS_PATH = PROJECT_ROOT / "python_common" / "analysis.py"
 TAXONOMY_PATH = PROJECT_ROOT / "python_common" / "taxonomy.py"
@@ -23,6 +25,7 @@ parser_module = types.ModuleType("parser")
 
 rapidfuzz_module = types.ModuleType("rapidfuzz")
 fuzz_module = types.ModuleType("rapidfuzz.fuzz")
+process_module = types.ModuleType("rapidfuzz.process")
 
 
 def _simple_ratio(lhs: object, rhs: object) -> int:
@@ -37,11 +40,23 @@ def _simple_ratio(lhs: object, rhs: object) -> int:
     return int(SequenceMatcher(None, left, right).ratio() * 100)
 
 
+def _simple_extract_one(query, choices, *, scorer=_simple_ratio, score_cutoff=0):
+    best = None
+    for index, choice in enumerate(choices):
+        score = scorer(query, choice)
+        if score >= score_cutoff and (best is None or score > best[1]):
+            best = (choice, score, index)
+    return best
+
+
 fuzz_module.token_set_ratio = _simple_ratio  # type: ignore[attr-defined]
 fuzz_module.partial_ratio = _simple_ratio  # type: ignore[attr-defined]
+process_module.extractOne = _simple_extract_one  # type: ignore[attr-defined]
 rapidfuzz_module.fuzz = fuzz_module  # type: ignore[attr-defined]
+rapidfuzz_module.process = process_module  # type: ignore[attr-defined]
 sys.modules.setdefault("rapidfuzz", rapidfuzz_module)
 sys.modules.setdefault("rapidfuzz.fuzz", fuzz_module)
+sys.modules.setdefault("rapidfuzz.process", process_module)
 
 
 def _parse_datetime(value: str) -> datetime:
@@ -212,6 +227,29 @@ def test_hardware_match_with_special_characters() -> None:
     assert ticket.final_item_category == "Audio / Video Devices"
 
 
+def test_substring_keyword_index_matches_plain_scan() -> None:
+    items = [f"Item Thing {index}" for index in range(120)]
+    taxonomy = build_taxonomy_model(
+        None,
+        available_taxonomy=build_metadata_taxonomy(
+            categories=["Hardware"],
+            subcategories=[("Hardware", ["Peripherals"])],
+            item_categories=[(("Hardware", "Peripherals"), items + ["Audio / Video Devices"])],
+        ),
+    )
+    analyzer = TicketAnalyzer(taxonomy=taxonomy)
+    assert analyzer._substring_index is not None
+    texts = [
+        "printer for item thing 42 and item-thing-7 is offline",
+        "conference room audio / video devices down",
+        "nothing relevant here",
+        "",
+    ]
+    for text in texts:
+        expected = {norm for norm in analyzer._substring_keywords if norm in text}
+        assert analyzer._find_substring_keywords(text) == expected
+
+
 def test_proximity_rules_create_expected_leaf_matches() -> None:
     config = {
         "priority_order": [
@@ -508,6 +546,49 @@ def test_fallback_to_general_it_questions() -> None:
     assert ticket.final_sub_category == "Questions"
 
 
+def test_identical_tickets_share_classification() -> None:
+    taxonomy = build_taxonomy_model(
+        None,
+        available_taxonomy=build_metadata_taxonomy(
+            categories=["Hardware"],
+            subcategories=[("Hardware", ["Peripherals"])],
+            item_categories=[(("Hardware", "Peripherals"), ["Audio / Video Devices"])],
+        ),
+    )
+    analyzer = TicketAnalyzer(taxonomy=taxonomy)
+    first = make_ticket(ticket_id=410, subject="Monitor alert", description="audio / video devices offline")
+    second = make_ticket(ticket_id=411, subject="Monitor alert", description="audio / video devices offline")
+
+    suggestions = analyzer.suggest_categories([first, second])
+
+    assert suggestions[410] == suggestions[411]
+    assert suggestions[410] is not suggestions[411]
+    assert second.final_item_category == first.final_item_category == "Audio / Video Devices"
+
+
+def test_analysis_passes_accept_shared_tokens() -> None:
+    taxonomy = build_taxonomy_model(
+        None,
+        available_taxonomy=build_metadata_taxonomy(
+            categories=["Hardware"], subcategories=[], item_categories=[]
+        ),
+    )
+    tickets = [
+        make_ticket(ticket_id=420 + index, subject="Printer jammed", description=f"floor {index} printer")
+        for index in range(3)
+    ]
+    analyzer = TicketAnalyzer(taxonomy=taxonomy, min_keyword_frequency=3)
+    expected_keywords = analyzer.detect_repeating_keywords(tickets)
+    expected_suggestions = analyzer.suggest_categories(tickets)
+    assert ("printer", 3) in expected_keywords
+
+    tokens = analyzer.tokenize_tickets(tickets)
+    assert analyzer.suggest_categories(tickets, tokens=tokens) == expected_suggestions
+    assert analyzer.detect_repeating_keywords(tickets, tokens=tokens) == expected_keywords
+    with pytest.raises(ValueError):
+        analyzer.detect_repeating_keywords(tickets, tokens=tokens[:2])
+
+
 def test_tfidf_similarity_uses_assigned_ticket_text() -> None:
     taxonomy = build_taxonomy_model(
         None,
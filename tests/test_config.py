@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+from importlib import util
+from pathlib import Path
+import os
+import sys
+import types
+
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+CONFIG_PATH = PROJECT_ROOT / "python_common" / "config.py"
+
+package = types.ModuleType("python_common")
+package.__path__ = [str(PROJECT_ROOT / "python_common")]
+sys.modules.setdefault("python_common", package)
+
+spec = util.spec_from_file_location("python_common._config_under_test", CONFIG_PATH)
+assert spec and spec.loader
+config_module = util.module_from_spec(spec)
+spec.loader.exec_module(config_module)
+
+load_config = config_module.load_config
+clear_config_cache = config_module.clear_config_cache
+
+
+def test_load_config_returns_independent_copies(tmp_path: Path) -> None:
+    config_file = tmp_path / "config.yaml"
+    config_file.write_text("logging:\n  console:\n    enabled: true\n", encoding="utf-8")
+    clear_config_cache()
+
+    first = load_config(config_file)
+    first["logging"]["console"]["enabled"] = False
+    second = load_config(config_file)
+
+    assert second["logging"]["console"]["enabled"] is True
+
+
+def test_load_config_reloads_after_file_changes(tmp_path: Path) -> None:
+    config_file = tmp_path / "config.yaml"
+    config_file.write_text("report:\n  name: first\n", encoding="utf-8")
+    clear_config_cache()
+
+    assert load_config(config_file)["report"]["name"] == "first"
+
+    config_file.write_text("report:\n  name: second\n", encoding="utf-8")
+    stat_result = config_file.stat()
+    os.utime(config_file, ns=(stat_result.st_atime_ns, stat_result.st_mtime_ns + 1_000_000))
+
+    assert load_config(config_file)["report"]["name"] == "second"
+
+
+def test_load_config_reloads_when_only_the_size_changes(tmp_path: Path) -> None:
+    config_file = tmp_path / "config.yaml"
+    config_file.write_text("report:\n  name: first\n", encoding="utf-8")
+    clear_config_cache()
+    original = config_file.stat()
+
+    assert load_config(config_file)["report"]["name"] == "first"
+
+    config_file.write_text("report:\n  name: rewritten\n", encoding="utf-8")
+    os.utime(config_file, ns=(original.st_atime_ns, original.st_mtime_ns))
+
+    assert load_config(config_file)["report"]["name"] == "rewritten"
@@ -33,6 +33,7 @@ sys.modules.setdefault("dateutil.parser", parser_stub)
 rapidfuzz_stub = types.ModuleType("rapidfuzz")
 fuzz_stub = types.SimpleNamespace(token_set_ratio=lambda *_args, **_kwargs: 0)
 rapidfuzz_stub.fuzz = fuzz_stub
+rapidfuzz_stub.process = types.SimpleNamespace(extractOne=lambda *_args, **_kwargs: None)
 sys.modules.setdefault("rapidfuzz", rapidfuzz_stub)
 
 
@@ -27,6 +27,10 @@ def _session_factory() -> MagicMock:
 requests_stub.Session = MagicMock(side_effect=_session_factory)
 sys.modules.setdefault("requests", requests_stub)
 
+adapters_stub = types.ModuleType("requests.adapters")
+adapters_stub.HTTPAdapter = MagicMock()
+sys.modules.setdefault("requests.adapters", adapters_stub)
+
 spec = util.spec_from_file_location("python_common.freshservice_client", MODULE_PATH)
 assert spec and spec.loader
 freshservice_client = util.module_from_spec(spec)
@@ -211,6 +215,90 @@ def test_iter_requesters_paginates() -> None:
     assert [r["id"] for r in seen] == [1, 2, 3]
 
 
+def test_iter_tickets_prefetch_preserves_page_order() -> None:
+    client = FreshserviceClient(
+        base_url="https://example.freshservice.com", api_key="dummy", per_page=30, prefetch_pages=3
+    )
+
+    total = 100
+    requested_pages: list[int] = []
+
+    def fake_request(method: str, path: str, **kwargs: Any) -> dict[str, object]:
+        assert method == "GET"
+        assert path == "/api/v2/tickets"
+        page = kwargs["params"]["page"]
+        requested_pages.append(page)
+        start = (page - 1) * 30
+        ids = range(start + 1, min(start + 30, total) + 1)
+        return {"tickets": [{"id": idx} for idx in ids], "meta": {"total_items": total}}
+
+    client._request = fake_request  # type: ignore[method-assign]
+
+    tickets = list(client.iter_tickets())
+
+    assert [ticket["id"] for ticket in tickets] == list(range(1, total + 1))
+    assert sorted(requested_pages) == [1, 2, 3, 4]
+
+
+def test_prefetch_workers_use_their_own_sessions() -> None:
+    client = FreshserviceClient(
+        base_url="https://example.freshservice.com", api_key="dummy", per_page=30, prefetch_pages=3
+    )
+    client.session = _session_factory()
+    client.session.auth = ("dummy", "X")
+    client.session.headers = {"Accept": "application/json"}
+    total = 100
+    sessions_by_page: dict[int, Any] = {}
+
+    def fake_session_request(method: str, url: str, **kwargs: Any) -> MagicMock:
+        page = kwargs["params"]["page"]
+        sessions_by_page[page] = client._thread_state.__dict__.get("session", client.session)
+        start = (page - 1) * 30
+        response = _mock_response()
+        response.json.return_value = {
+            "tickets": [{"id": idx} for idx in range(start + 1, min(start + 30, total) + 1)],
+            "meta": {"total_items": total},
+        }
+        return response
+
+    worker_sessions: list[Any] = []
+    original_open = client._open_worker_session
+
+    def open_worker_session() -> None:
+        original_open()
+        session = client._thread_state.session
+        session.request.side_effect = fake_session_request
+        worker_sessions.append(session)
+
+    client._open_worker_session = open_worker_session  # type: ignore[method-assign]
+    client.session.request.side_effect = fake_session_request
+
+    tickets = list(client.iter_tickets())
+
+    assert len(tickets) == total
+    assert sessions_by_page[1] is client.session
+    assert worker_sessions
+    for page in (2, 3, 4):
+        assert sessions_by_page[page] is not client.session
+        assert sessions_by_page[page] in worker_sessions
+    for session in worker_sessions:
+        assert session.auth == ("dummy", "X")
+        assert session.headers == {"Accept": "application/json"}
+
+
+def test_rate_limiter_only_waits_when_budget_is_spent(monkeypatch: pytest.MonkeyPatch) -> None:
+    clock = [100.0]
+    monkeypatch.setattr(freshservice_client.time, "monotonic", lambda: clock[0])
+    limiter = freshservice_client._RateLimiter(60)
+
+    assert limiter.reserve() == 0.0
+    assert limiter.reserve() == pytest.approx(1.0)
+    assert limiter.reserve() == pytest.approx(2.0)
+
+    clock[0] += 10.0
+    assert limiter.reserve() == 0.0
+
+
 def test_get_requester_returns_payload() -> None:
     client = FreshserviceClient(base_url="https://example.freshservice.com", api_key="dummy")
 
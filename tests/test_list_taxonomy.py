@@ -51,9 +51,13 @@ rapidfuzz_stub = types.ModuleType("rapidfuzz")
 rapidfuzz_fuzz_stub = types.ModuleType("rapidfuzz.fuzz")
 rapidfuzz_fuzz_stub.token_set_ratio = lambda a, b: 0
 rapidfuzz_fuzz_stub.partial_ratio = lambda a, b: 0
+rapidfuzz_process_stub = types.ModuleType("rapidfuzz.process")
+rapidfuzz_process_stub.extractOne = lambda *args, **kwargs: None
 rapidfuzz_stub.fuzz = rapidfuzz_fuzz_stub
+rapidfuzz_stub.process = rapidfuzz_process_stub
 sys.modules.setdefault("rapidfuzz", rapidfuzz_stub)
 sys.modules.setdefault("rapidfuzz.fuzz", rapidfuzz_fuzz_stub)
+sys.modules.setdefault("rapidfuzz.process", rapidfuzz_process_stub)
 
 MODULE_PATH = PROJECT_ROOT / "tools" / "list_taxonomy.py"
 spec = util.spec_from_file_location("freshservice_tools.list_taxonomy", MODULE_PATH)
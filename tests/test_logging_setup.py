@@ -0,0 +1,45 @@
+"""Tests for the logging configuration helpers."""
+
+from __future__ import annotations
+
+import logging
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from python_common import logging_setup  # noqa: E402
+
+
+def test_file_records_are_written_through_the_queue(tmp_path: Path) -> None:
+    log_path = tmp_path / "logs" / "workflow.log"
+    config = {
+        "logging": {
+            "console": {"enabled": False},
+            "file": {"enabled": True, "level": "INFO", "path": str(log_path)},
+        }
+    }
+    root = logging.getLogger()
+    previous_handlers = list(root.handlers)
+    previous_level = root.level
+    try:
+        logging_setup.configure_logging(config, base_dir=tmp_path)
+        logger = logging.getLogger("python_common.tests")
+        logger.debug("filtered %s", "out")
+        logger.info("ticket %s classified", 42)
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            logger.exception("failed")
+        logging_setup._stop_file_listener()
+    finally:
+        root.handlers[:] = previous_handlers
+        root.setLevel(previous_level)
+        logging.captureWarnings(False)
+
+    contents = log_path.read_text(encoding="utf-8")
+    assert "| INFO | python_common.tests | ticket 42 classified" in contents
+    assert "filtered out" not in contents
+    assert "ValueError: boom" in contents
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+from collections import Counter
 from datetime import datetime, timezone
+import json
 from pathlib import Path
 import sys
 
@@ -15,7 +17,12 @@ for module_name in list(sys.modules):
         sys.modules.pop(module_name, None)
 
 from python_common import workflow
-from python_common.report_generation import TicketReportBuilder, TicketSnapshot
+from python_common.report_generation import (
+    TicketReportBuilder,
+    TicketSnapshot,
+    render_pdf,
+    save_metrics_json,
+)
 
 
 def _make_snapshot(**overrides):
@@ -71,6 +78,75 @@ def test_ticket_report_builder_metrics_basic():
     assert metrics["technical"]["data_quality"]["missing_category"] == 0
 
 
+def test_snapshot_resolution_state_follows_field_changes():
+    assert _make_snapshot().is_resolved
+    closed_by_status = _make_snapshot(resolved_at=None, status=5)
+    assert closed_by_status.is_resolved and not closed_by_status.is_open
+    pending = _make_snapshot(resolved_at=None, status=None)
+    assert pending.is_open
+    pending.status = 4
+    assert pending.is_resolved
+
+
+def test_build_is_memoised_until_tickets_change():
+    builder = TicketReportBuilder([_make_snapshot()], now=datetime(2024, 1, 10, tzinfo=timezone.utc))
+    first = builder.build()
+    assert builder.build() is first
+
+    builder.add_tickets([_make_snapshot(ticket_id=2, category="Hardware")])
+    refreshed = builder.build()
+    assert refreshed is not first
+    assert refreshed["operational"]["ticket_volume_trend"]["total_created"] == 2
+    assert refreshed["operational"]["category_breakdown"]["categories"]["Hardware"] == 1
+
+    builder.now = datetime(2024, 2, 10, tzinfo=timezone.utc)
+    assert builder.build()["generated_at"] == "2024-02-10T00:00:00+00:00"
+
+    builder.tickets[1].category = "Software"
+    builder.invalidate()
+    assert builder.build()["operational"]["category_breakdown"]["categories"]["Software"] == 1
+
+
+def test_add_tickets_matches_a_full_rebuild():
+    now = datetime(2024, 1, 10, tzinfo=timezone.utc)
+    initial = [_make_snapshot(ticket_id=1), _make_snapshot(ticket_id=2, responder_id=None)]
+    arrivals = [
+        _make_snapshot(ticket_id=3, resolved_at=None, status=2, department_id=None),
+        _make_snapshot(ticket_id=4, responder_id=101, category="Hardware", reopened_count=2),
+    ]
+    incremental = TicketReportBuilder(initial, now=now)
+    incremental.build()
+    incremental.add_tickets(arrivals)
+
+    assert incremental.build() == TicketReportBuilder(initial + arrivals, now=now).build()
+
+
+def test_render_pdf_with_filters_and_long_lines(tmp_path: Path):
+    tickets = [_make_snapshot(responder_id="agent-" + "x" * 200)]
+    metrics = TicketReportBuilder(tickets, now=datetime(2024, 1, 10, tzinfo=timezone.utc)).build()
+    filters = {"start_date": "2024-01-01", "end_date": "2024-01-31", "categories": ["Remote Access"]}
+
+    output_path = tmp_path / "report.pdf"
+    render_pdf(metrics, filters, output_path)
+
+    assert output_path.read_bytes().startswith(b"%PDF")
+
+
+def test_metrics_json_handles_deeply_nested_values(tmp_path: Path):
+    nested: dict = {"leaf": Counter({("Hardware", None): 2})}
+    for _ in range(600):
+        nested = {"child": nested, "when": (datetime(2024, 1, 1, tzinfo=timezone.utc),)}
+
+    output = tmp_path / "metrics.json"
+    save_metrics_json(nested, output)
+
+    loaded = json.loads(output.read_text(encoding="utf-8"))
+    assert loaded["when"] == ["2024-01-01T00:00:00+00:00"]
+    for _ in range(600):
+        loaded = loaded["child"]
+    assert loaded == {"leaf": {"Hardware > ": 2}}
+
+
 def test_generate_reports_creates_bundle(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
     config_path = tmp_path / "config.yaml"
     config_path.write_text(
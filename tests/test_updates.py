@@ -397,3 +397,27 @@ def test_update_ticket_categories_collects_errors(caplog) -> None:
     assert failure.status_code == 422
     assert "Invalid taxonomy mapping" in failure.message
     assert "Unprocessable Entity" in caplog.text
+
+
+def test_review_worksheet_loads_actionable_rows_by_column_name(tmp_path) -> None:
+    review_csv = tmp_path / "review.csv"
+    review_csv.write_text(
+        "review_notes,ticket_id,manager_decision,final_category,suggestion_confidence\n"
+        " check vendor ,7, Approve ,Hardware ,0.75\n"
+        ",8,no,Software,0.5\n"
+        "\n"
+        ",9,skip\n",
+        encoding="utf-8",
+    )
+
+    rows = review_module.ReviewWorksheet(review_csv).load_rows()
+
+    assert [row.ticket_id for row in rows] == [7, 9]
+    first, second = rows
+    assert first.manager_decision == "approve"
+    assert first.final_category == "Hardware"
+    assert first.review_notes == "check vendor"
+    assert first.current_category == ""
+    assert first.suggestion_confidence == 0.75
+    assert second.final_category == ""
+    assert second.suggestion_confidence is None